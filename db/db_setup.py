@@ -14,17 +14,44 @@ Or with environment variables:
 
 import argparse
 import os
+import re
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import psycopg2
-from psycopg2 import sql
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2 import errors, sql
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT, ISOLATION_LEVEL_READ_COMMITTED
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# Read buffer for SQL files and pattern for pg_dump-style inline COPY data
+SQL_FILE_BUFFER_SIZE = 1 << 20
+MAX_SCRIPT_READERS = 8
+COPY_FROM_STDIN_PATTERN = re.compile(r'^\s*COPY\s+.+\s+FROM\s+STDIN\b', re.IGNORECASE)
+
+
+class CopyDataStream:
+    """Read-only file view over inline COPY data, ending at the '\\.' terminator line."""
+
+    def __init__(self, file):
+        self._file = file
+        self._finished = False
+
+    def read(self, size=-1):
+        if self._finished:
+            return ''
+        line = self._file.readline()
+        if not line or line.rstrip('\r\n') == '\\.':
+            self._finished = True
+            return ''
+        return line
+
+    readline = read
+
+
 def get_config():
     """Get database configuration from command line arguments or environment variables."""
     parser = argparse.ArgumentParser(description='Setup PostgreSQL database and run initialization scripts')
@@ -41,6 +68,8 @@ def get_config():
                        help='Database host (default: localhost)')
     parser.add_argument('--cleanup', action='store_true',
                        help='Drop existing tables before creating new ones')
+    parser.add_argument('--strict-check', action='store_true',
+                       help='Query pg_catalog for the database before attempting to create it')
     
     return parser.parse_args()
 
@@ -71,26 +100,50 @@ def database_exists(cursor, db_name):
     return cursor.fetchone() is not None
 
 
-def create_database(cursor, db_name):
-    """Create database if it doesn't exist."""
-    if database_exists(cursor, db_name):
+def create_database(cursor, db_name, strict_check=False):
+    """
+    Create database if it doesn't exist.
+
+    By default the CREATE is attempted directly and a duplicate is detected from
+    the error, saving the pg_catalog round-trip. Pass strict_check to probe first.
+    """
+    if strict_check and database_exists(cursor, db_name):
         logger.info(f"Database '{db_name}' already exists")
         return False
     
     logger.info(f"Creating database '{db_name}'...")
-    cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name)))
+    try:
+        cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name)))
+    except errors.DuplicateDatabase:
+        logger.info(f"Database '{db_name}' already exists")
+        return False
     logger.info(f"Database '{db_name}' created successfully")
     return True
 
 
 def run_sql_file(cursor, sql_file_path):
-    """Execute SQL commands from a file."""
+    """
+    Execute SQL commands from a file.
+
+    The file is read through a buffered stream. Plain SQL is executed as-is, while
+    the inline data of COPY ... FROM STDIN statements is streamed to copy_expert
+    up to its terminating '\\.' line instead of being loaded into memory.
+    """
     try:
-        with open(sql_file_path, 'r') as file:
-            sql_content = file.read()
+        executed = False
+        with open(sql_file_path, 'r', buffering=SQL_FILE_BUFFER_SIZE) as file:
+            sql_lines = []
+            for line in iter(file.readline, ''):
+                if COPY_FROM_STDIN_PATTERN.match(line):
+                    executed = _execute_sql_lines(cursor, sql_lines) or executed
+                    sql_lines = []
+                    cursor.copy_expert(line, CopyDataStream(file))
+                    executed = True
+                else:
+                    sql_lines.append(line)
+            executed = _execute_sql_lines(cursor, sql_lines) or executed
         
-        if sql_content.strip():
-            cursor.execute(sql_content)
+        if executed:
             logger.info(f"Successfully executed SQL file: {sql_file_path}")
         else:
             logger.warning(f"SQL file is empty: {sql_file_path}")
@@ -103,6 +156,139 @@ def run_sql_file(cursor, sql_file_path):
         raise
 
 
+def _execute_sql_lines(cursor, sql_lines):
+    """Execute accumulated SQL lines, returning False if there was nothing to run."""
+    sql_content = ''.join(sql_lines)
+    if not sql_content.strip():
+        return False
+    cursor.execute(sql_content)
+    return True
+
+
+def has_copy_from_stdin(sql_file_path):
+    """Check whether a SQL file contains a COPY ... FROM STDIN statement."""
+    with open(sql_file_path, 'r', buffering=SQL_FILE_BUFFER_SIZE) as file:
+        return any(COPY_FROM_STDIN_PATTERN.match(line) for line in file)
+
+
+def run_init_scripts(conn, sql_files):
+    """
+    Execute all initialization scripts in a single round-trip and transaction.
+
+    The scripts are concatenated and sent as one multi-statement query, so either
+    every script is applied or none is. On failure, the error position reported
+    by PostgreSQL is mapped back to the script it falls in; errors without a
+    position are located by replaying the batch script by script. Scripts containing
+    COPY ... FROM STDIN cannot be concatenated and are streamed via run_sql_file
+    inside the same transaction.
+    """
+    conn.set_isolation_level(ISOLATION_LEVEL_READ_COMMITTED)
+    try:
+        with conn.cursor() as cursor:
+            batch = []
+            executed_count = 0
+            for sql_file_path, sql_content in read_init_scripts(sql_files):
+                if sql_content is None:
+                    executed_count += _execute_script_batch(cursor, batch)
+                    batch = []
+                    run_sql_file(cursor, sql_file_path)
+                    executed_count += 1
+                    continue
+
+                if not sql_content.strip():
+                    logger.warning(f"SQL file is empty: {sql_file_path}")
+                    continue
+                batch.append((sql_file_path, sql_content))
+            executed_count += _execute_script_batch(cursor, batch)
+        conn.commit()
+        logger.info(f"Successfully executed {executed_count} SQL initialization scripts")
+    except psycopg2.Error:
+        conn.rollback()
+        raise
+    finally:
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+
+
+def read_init_scripts(sql_files):
+    """
+    Read script contents concurrently, preserving order.
+
+    Only the file reads run in parallel; execution stays on the single connection.
+    Scripts containing COPY ... FROM STDIN are not loaded into memory and get
+    None as content, since run_sql_file streams them.
+    """
+    if not sql_files:
+        return []
+
+    def read_script(sql_file_path):
+        if has_copy_from_stdin(sql_file_path):
+            return sql_file_path, None
+        with open(sql_file_path, 'r', buffering=SQL_FILE_BUFFER_SIZE) as file:
+            return sql_file_path, file.read()
+
+    with ThreadPoolExecutor(max_workers=min(MAX_SCRIPT_READERS, len(sql_files))) as executor:
+        return list(executor.map(read_script, sql_files))
+
+
+# Savepoint set at the start of each script batch, so a failed batch can be replayed script by script
+SCRIPT_BATCH_SAVEPOINT = 'init_script_batch'
+
+
+def _execute_script_batch(cursor, batch):
+    """Execute (path, content) scripts as one query and return how many ran."""
+    if not batch:
+        return 0
+
+    # The savepoint travels in the same query, so the batch is still a single round-trip
+    savepoint = f"SAVEPOINT {SCRIPT_BATCH_SAVEPOINT};\n"
+    script_offsets = []
+    offset = len(savepoint)
+    for sql_file_path, sql_content in batch:
+        script_offsets.append((offset, sql_file_path))
+        offset += len(sql_content) + 1
+
+    try:
+        cursor.execute(savepoint + "\n".join(sql_content for _, sql_content in batch))
+    except psycopg2.Error as e:
+        failed_script = _find_failed_script(script_offsets, e) or _replay_failed_script(cursor, batch)
+        logger.error(f"Error executing SQL file {failed_script}: {e}")
+        raise
+    return len(batch)
+
+
+def _find_failed_script(script_offsets, error):
+    """Map a PostgreSQL error position in the combined SQL back to its script, or None if it has none."""
+    position = getattr(error.diag, 'statement_position', None)
+    if not position:
+        return None
+
+    failed_script = None
+    for start, sql_file_path in script_offsets:
+        if int(position) - 1 >= start:
+            failed_script = sql_file_path
+    return failed_script
+
+
+def _replay_failed_script(cursor, batch):
+    """
+    Find the failing script by rolling back to the batch savepoint and re-running scripts one at a time.
+
+    Used for errors raised while a statement executes (duplicate objects, constraint
+    violations, errors inside DO blocks), which carry no statement position. The
+    enclosing transaction is rolled back by the caller either way.
+    """
+    try:
+        cursor.execute(f"ROLLBACK TO SAVEPOINT {SCRIPT_BATCH_SAVEPOINT}")
+        for sql_file_path, sql_content in batch:
+            try:
+                cursor.execute(sql_content)
+            except psycopg2.Error:
+                return sql_file_path
+    except psycopg2.Error as e:
+        logger.debug(f"Could not replay init scripts to locate the failure: {e}")
+    return 'unknown script'
+
+
 def cleanup_tables(cursor):
     """Drop existing tables in reverse dependency order."""
     tables_to_drop = ['inference', 'model', 'training', 'jobs']
@@ -154,7 +340,7 @@ def main():
         
         with conn.cursor() as cursor:
             # Create database if it doesn't exist
-            create_database(cursor, config.db_name)
+            create_database(cursor, config.db_name, config.strict_check)
         
         conn.close()
         
@@ -168,20 +354,19 @@ def main():
             config.db_name
         )
         
-        with db_conn.cursor() as cursor:
-            # Cleanup tables if requested
-            if config.cleanup:
+        # Cleanup tables if requested
+        if config.cleanup:
+            with db_conn.cursor() as cursor:
                 cleanup_tables(cursor)
-            
-            # Run initialization scripts
-            init_scripts = find_init_scripts()
-            
-            if not init_scripts:
-                logger.warning("No initialization scripts found")
-            else:
-                logger.info("Running initialization scripts...")
-                for script in init_scripts:
-                    run_sql_file(cursor, script)
+        
+        # Run initialization scripts
+        init_scripts = find_init_scripts()
+        
+        if not init_scripts:
+            logger.warning("No initialization scripts found")
+        else:
+            logger.info("Running initialization scripts...")
+            run_init_scripts(db_conn, init_scripts)
         
         db_conn.close()
         
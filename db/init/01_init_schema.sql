@@ -49,4 +49,41 @@ CREATE TABLE IF NOT EXISTS inference (
     error_message TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
-);
\ No newline at end of file
+);
+
+-- Keep inference.updated_at current on every UPDATE
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_inference_updated_at ON inference;
+CREATE TRIGGER trg_inference_updated_at
+    BEFORE UPDATE ON inference
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- Per-table change counters, used as version markers for list ETags. The statement trigger
+-- bumps the row inside the writing transaction, so a new value only becomes visible when
+-- that transaction commits and concurrent writers are ordered by the row lock. The lock is
+-- held until commit, so transactions writing to inference queue behind each other from their
+-- first write on. Accepted: inference is written by single autocommit INSERTs and by poller
+-- transactions whose inference UPDATE is their last statement, so the lock is held briefly.
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(63) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES (TG_TABLE_NAME, 1)
+    ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_inference_version ON inference;
+CREATE TRIGGER trg_inference_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON inference
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
@@ -0,0 +1,22 @@
+-- Indexes for DAO query predicates and list ordering
+
+-- jobs: active-job polling filters on status and job_type, lookup by SLURM id
+CREATE INDEX IF NOT EXISTS ix_jobs_status_job_type ON jobs(status, job_type);
+CREATE INDEX IF NOT EXISTS ix_jobs_sbatch_id ON jobs(sbatch_id);
+
+-- training: lookups by name, status and job
+CREATE INDEX IF NOT EXISTS ix_training_name ON training(name);
+CREATE INDEX IF NOT EXISTS ix_training_status ON training(status);
+CREATE INDEX IF NOT EXISTS ix_training_job_id ON training(job_id);
+
+-- model: lookups by name and training, list ordering
+CREATE INDEX IF NOT EXISTS ix_model_model_name ON model(model_name);
+CREATE INDEX IF NOT EXISTS ix_model_training_id ON model(training_id);
+CREATE INDEX IF NOT EXISTS ix_model_created_at ON model(created_at DESC);
+
+-- inference: lookups by model, status and job, list ordering
+CREATE INDEX IF NOT EXISTS ix_inference_model_id ON inference(model_id) INCLUDE (status);
+CREATE INDEX IF NOT EXISTS ix_inference_status ON inference(status);
+CREATE INDEX IF NOT EXISTS ix_inference_job_id ON inference(job_id);
+-- (created_at, predict_id) matches the list ordering and keyset cursor; INCLUDE makes list summaries index-only
+CREATE INDEX IF NOT EXISTS ix_inference_created_at_predict_id ON inference(created_at, predict_id) INCLUDE (model_id, status);
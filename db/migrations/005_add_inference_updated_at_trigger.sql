@@ -0,0 +1,42 @@
+-- Migration: Maintain inference.updated_at in the database
+-- Created: 2026-10-15
+-- Description:
+--   - Add set_updated_at() trigger function
+--   - Add BEFORE UPDATE trigger on inference so updated_at no longer has to be sent by the application
+
+-- ==== FORWARD MIGRATION ====
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_inference_updated_at ON inference;
+CREATE TRIGGER trg_inference_updated_at
+    BEFORE UPDATE ON inference
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+-- ==== ROLLBACK MIGRATION ====
+
+-- To rollback this migration, run the following commands:
+--
+-- DROP TRIGGER IF EXISTS trg_inference_updated_at ON inference;
+-- DROP FUNCTION IF EXISTS set_updated_at();
+
+-- ==== VERIFICATION ====
+
+-- Verify the migration was successful
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.triggers
+        WHERE event_object_table = 'inference'
+        AND trigger_name = 'trg_inference_updated_at'
+    ) THEN
+        RAISE EXCEPTION 'Migration failed: trg_inference_updated_at trigger missing on inference table';
+    END IF;
+
+    RAISE NOTICE 'Migration completed successfully';
+END $$;
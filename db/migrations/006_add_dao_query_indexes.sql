@@ -0,0 +1,53 @@
+-- Migration: Add indexes for DAO query predicates
+-- Created: 2026-10-15
+-- Description:
+--   - Index the columns used in DAO WHERE clauses and list ORDER BY clauses
+--   - Built CONCURRENTLY so existing tables are not locked; run with psql outside a transaction
+
+-- ==== FORWARD MIGRATION ====
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_status_job_type ON jobs(status, job_type);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_sbatch_id ON jobs(sbatch_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_name ON training(name);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_status ON training(status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_training_job_id ON training(job_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_model_model_name ON model(model_name);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_model_training_id ON model(training_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_model_created_at ON model(created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_model_id ON inference(model_id) INCLUDE (status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_status ON inference(status);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_job_id ON inference(job_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_created_at ON inference(created_at DESC);
+
+-- ==== ROLLBACK MIGRATION ====
+
+-- To rollback this migration, run the following commands:
+--
+-- DROP INDEX IF EXISTS ix_jobs_status_job_type, ix_jobs_sbatch_id,
+--     ix_training_name, ix_training_status, ix_training_job_id,
+--     ix_model_model_name, ix_model_training_id, ix_model_created_at,
+--     ix_inference_model_id, ix_inference_status, ix_inference_job_id, ix_inference_created_at;
+
+-- ==== VERIFICATION ====
+
+-- Verify the migration was successful
+DO $$
+BEGIN
+    IF (
+        SELECT COUNT(*) FROM pg_indexes
+        WHERE schemaname = 'public'
+        AND indexname IN (
+            'ix_jobs_status_job_type', 'ix_jobs_sbatch_id',
+            'ix_training_name', 'ix_training_status', 'ix_training_job_id',
+            'ix_model_model_name', 'ix_model_training_id', 'ix_model_created_at',
+            'ix_inference_model_id', 'ix_inference_status', 'ix_inference_job_id', 'ix_inference_created_at'
+        )
+    ) <> 12 THEN
+        RAISE EXCEPTION 'Migration failed: not all DAO query indexes exist';
+    END IF;
+
+    RAISE NOTICE 'Migration completed successfully';
+END $$;
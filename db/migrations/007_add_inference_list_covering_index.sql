@@ -0,0 +1,21 @@
+-- Migration: Covering index for the prediction list
+-- Created: 2026-10-15
+-- Description:
+--   - list_predictions orders by (created_at DESC, predict_id DESC) and pages with a
+--     (created_at, predict_id) keyset cursor; it selects only predict_id, model_id,
+--     status and created_at
+--   - Replaces ix_inference_created_at with a composite index on both ordering
+--     columns that INCLUDEs model_id and status, so list pages are index-only scans
+
+-- ==== FORWARD MIGRATION ====
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_created_at_predict_id
+    ON inference(created_at, predict_id) INCLUDE (model_id, status);
+DROP INDEX CONCURRENTLY IF EXISTS ix_inference_created_at;
+
+-- ==== ROLLBACK MIGRATION ====
+
+-- To rollback this migration, run the following commands:
+--
+-- CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_inference_created_at ON inference(created_at DESC);
+-- DROP INDEX CONCURRENTLY IF EXISTS ix_inference_created_at_predict_id;
@@ -0,0 +1,54 @@
+-- Migration: Change counter for the prediction list ETag
+-- Created: 2026-10-15
+-- Description:
+--   - Add table_versions, a per-table change counter used as the prediction list version marker
+--   - The counter is bumped by a statement trigger on every INSERT, UPDATE, DELETE or TRUNCATE of
+--     inference, inside the writing transaction, so the new value becomes visible exactly when the
+--     write commits (a timestamp column would be set before commit and could go backwards)
+--   - The bumped row stays locked until the writer commits, so transactions writing to inference
+--     queue behind each other from their first write on. Accepted: inference is written by single
+--     autocommit INSERTs and by poller transactions whose inference UPDATE is their last statement
+
+-- ==== FORWARD MIGRATION ====
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    table_name VARCHAR(63) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO table_versions (table_name, version) VALUES (TG_TABLE_NAME, 1)
+    ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_inference_version ON inference;
+CREATE TRIGGER trg_inference_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON inference
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version();
+
+-- ==== ROLLBACK MIGRATION ====
+
+-- To rollback this migration, run the following commands:
+--
+-- DROP TRIGGER IF EXISTS trg_inference_version ON inference;
+-- DROP FUNCTION IF EXISTS bump_table_version();
+-- DROP TABLE IF EXISTS table_versions;
+
+-- ==== VERIFICATION ====
+
+-- Verify the migration was successful
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.triggers
+        WHERE event_object_table = 'inference'
+        AND trigger_name = 'trg_inference_version'
+    ) THEN
+        RAISE EXCEPTION 'Migration failed: trg_inference_version trigger missing on inference table';
+    END IF;
+
+    RAISE NOTICE 'Migration completed successfully';
+END $$;
@@ -0,0 +1,18 @@
+"""Gunicorn configuration for the PIC service.
+
+Run from the serving directory:
+    gunicorn -c gunicorn.conf.py stroke_seg.app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+
+# Each worker process imports stroke_seg.app and starts its own job poller,
+# so keep a single worker by default and scale request concurrency with threads.
+workers = int(os.getenv('GUNICORN_WORKERS', '1'))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '60'))
+graceful_timeout = 30
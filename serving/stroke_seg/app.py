@@ -1,18 +1,30 @@
+import os
 import time
 
-from flask import Flask, jsonify
-from flask_cors import CORS
+from flask import Flask, jsonify, request
 
 from stroke_seg.controller import model_bp, prediction_bp
 from stroke_seg.controller.training_controller import training_bp
 from stroke_seg.controller.evaluation_controller import evaluation_bp
+from stroke_seg.controller.caching import conditional_response
+from stroke_seg.controller.pagination import NEXT_CURSOR_HEADER
 from stroke_seg.dao.database import get_pool_status, verify_connection, database
 from stroke_seg.config import validate_template_files
+from stroke_seg.json_provider import ORJSONProvider
+from stroke_seg.ttl_cache import ttl_cache
 from stroke_seg.logging_config import setup_logging, get_logger, add_request_id_to_request, log_request_info
 from stroke_seg.bl.poller.poller_facade import PollerFacade
 
 app = Flask(__name__)
-CORS(app)
+app.json = ORJSONProvider(app)
+
+# The API accepts requests from any origin, so the CORS headers are the same for every response
+_CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization, If-None-Match',
+    'Access-Control-Expose-Headers': NEXT_CURSOR_HEADER,
+}
 
 # Setup logging
 setup_logging('pic_service')
@@ -54,36 +66,57 @@ app.register_blueprint(evaluation_bp)
 
 
 # Request logging middleware
+_HEALTH_PATHS = frozenset(('/health', '/health/db', '/health/poller'))
+
 @app.before_request
 def before_request():
     """Add request ID and start timing."""
-    database.connect()
+    # No eager database.connect(): peewee checks a pooled connection out on the first
+    # query, so endpoints that never touch the database don't hold one.
     add_request_id_to_request()
-    from flask import request
-    request.start_time = time.time()
-    logger.info(f"Request started - {request.method} {request.path}")
+    if request.path in _HEALTH_PATHS:
+        # Probes are frequent and cheap; skip start/completion logging for them
+        return
+    request.start_time = time.monotonic()
+    logger.info("Request started - %s %s", request.method, request.path)
 
 @app.after_request
 def after_request(response):
-    """Log request completion."""
-    from flask import request
-    if hasattr(request, 'start_time'):
-        log_request_info(logger, request.start_time, response.status_code)
+    """Add CORS headers and log request completion."""
+    response.headers.update(_CORS_HEADERS)
+    start_time = getattr(request, 'start_time', None)
+    if start_time is not None:
+        log_request_info(logger, start_time, response.status_code)
+    return response
+
+@app.teardown_request
+def teardown_request(exception):
+    """Return the request's connection (if one was checked out) to the pool, even if the request failed."""
     if not database.is_closed():
         database.close()
-    return response
+
+# Health probes are served from a cache for HEALTH_CACHE_TTL seconds, so frequent scrapes
+# don't inspect the pool or poller internals on every hit. Each gunicorn worker has its own.
+HEALTH_CACHE_TTL = 1.0
+
+@ttl_cache(HEALTH_CACHE_TTL)
+def _db_health_body():
+    """Build the /health/db body from a fresh pool status."""
+    logger.debug("Checking database connection pool health")
+    pool_status = get_pool_status()
+    logger.info("Database health check successful - Active connections: %s", pool_status.get('active_connections', 'unknown'))
+    return {
+        "status": "healthy",
+        "pool": pool_status
+    }
+
+_poller_status = ttl_cache(HEALTH_CACHE_TTL)(poller_facade.get_status)
 
 @app.route('/health/db')
 def db_health():
     """Database connection pool health check endpoint."""
     try:
-        logger.debug("Checking database connection pool health")
-        pool_status = get_pool_status()
-        logger.info(f"Database health check successful - Active connections: {pool_status.get('active_connections', 'unknown')}")
-        return jsonify({
-            "status": "healthy",
-            "pool": pool_status
-        })
+        return conditional_response(jsonify(_db_health_body()))
     except Exception as e:
         logger.error(f"Database health check failed: {str(e)}", exc_info=True)
         return jsonify({
@@ -96,11 +129,11 @@ def poller_health():
     """Job poller health check endpoint."""
     try:
         logger.debug("Checking job poller health")
-        poller_status = poller_facade.get_status()
+        poller_status = _poller_status()
         
         is_healthy = poller_status.get('facade_running', False) and poller_status.get('poller_status', {}).get('is_running', False)
         
-        logger.info(f"Poller health check - Running: {is_healthy}")
+        logger.info("Poller health check - Running: %s", is_healthy)
         
         return jsonify({
             "status": "healthy" if is_healthy else "unhealthy",
@@ -121,7 +154,7 @@ def overall_health():
         # Check database
         db_healthy = True
         try:
-            get_pool_status()
+            _db_health_body()
         except Exception:
             db_healthy = False
         
@@ -148,5 +181,9 @@ def overall_health():
 # Error handling is now centralized in controllers using @handle_errors decorator
 
 if __name__ == '__main__':
+    # Development server only; production runs under gunicorn (see serving/gunicorn.conf.py)
+    dev_mode = os.getenv('FLASK_DEV', 'false').lower() in ('1', 'true', 'yes')
+    if not dev_mode:
+        logger.warning("Running the Flask development server - use gunicorn -c gunicorn.conf.py stroke_seg.app:app in production")
     logger.info("Starting POC ML Prediction Service on port 8080")
-    app.run(debug=True, host='0.0.0.0', port=8080)
\ No newline at end of file
+    app.run(debug=dev_mode, threaded=True, host='0.0.0.0', port=8080)
\ No newline at end of file
@@ -1,16 +1,17 @@
 import os
 import tempfile
+from typing import Union
 
 from stroke_seg.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-def create_temp_file(content: str, suffix: str = '.tmp') -> str:
+def create_temp_file(content: Union[str, bytes], suffix: str = '.tmp') -> str:
     """
     Create a temporary file with specified content.
 
     Args:
-        content: Content to write to the file
+        content: Content to write to the file (str is written as UTF-8)
         suffix: File suffix/extension
 
     Returns:
@@ -20,10 +21,15 @@ def create_temp_file(content: str, suffix: str = '.tmp') -> str:
         ModelCreationException: If file creation fails
     """
     try:
-        temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, text=True)
+        temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
 
-        with os.fdopen(temp_fd, 'w') as f:
-            f.write(content)
+        # Write the encoded bytes straight to the descriptor; os.write may write partially
+        data = memoryview(content.encode('utf-8') if isinstance(content, str) else content)
+        try:
+            while data:
+                data = data[os.write(temp_fd, data):]
+        finally:
+            os.close(temp_fd)
 
         logger.debug(f"Temporary file created: {temp_path}")
         return temp_path
@@ -1,7 +1,10 @@
 """Sbatch client for SLURM job submission operations."""
 
+import os
 import re
-from typing import Optional, Dict, Any
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from stroke_seg.logging_config import get_logger
@@ -10,19 +13,32 @@ from stroke_seg.bl.client.bash.bash_client import BashClient
 from stroke_seg.bl.client.fs.fs_client import create_temp_file, cleanup_file
 from .slurm_parser import parse_scontrol_output, extract_job_summary
 
+# squeue output format emitting scontrol-style Key=Value fields, one job per line, so
+# parse_scontrol_output/extract_job_summary handle both commands
+SQUEUE_JOB_FORMAT = 'JobId=%i JobState=%T StartTime=%S EndTime=%e Reason=%r'
+
+# Seconds a get_jobs_info result is reused; 0 disables caching
+SLURM_CACHE_TTL = float(os.getenv('SLURM_CACHE_TTL', '5'))
+
 
 class SlurmClient:
     """Handles sbatch-specific operations using the generic BashClient."""
     
-    def __init__(self, bash_client: Optional[BashClient] = None):
+    def __init__(self, bash_client: Optional[BashClient] = None, cache_ttl: Optional[float] = None):
         """
         Initialize the sbatch client.
         
         Args:
             bash_client: BashClient instance to use (creates new one if None)
+            cache_ttl: Seconds to reuse get_jobs_info results (default from SLURM_CACHE_TTL or 5)
         """
         self.logger = get_logger(__name__)
         self.bash_client = bash_client or BashClient()
+        self.cache_ttl = SLURM_CACHE_TTL if cache_ttl is None else cache_ttl
+        # SLURM job ID -> (fetch time on the monotonic clock, job summary)
+        self._jobs_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Serializes get_jobs_info callers, so concurrent misses wait for one query and then hit the cache
+        self._jobs_info_lock = threading.Lock()
     
     def extract_job_id(self, sbatch_output: str) -> str:
         """
@@ -201,6 +217,99 @@ class SlurmClient:
             self.logger.error(error_msg)
             raise ModelCreationException(error_msg)
     
+    def get_jobs_info(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get job information for many jobs, served from a short-lived cache when possible.
+        
+        Results are reused for cache_ttl seconds. When some jobs aren't cached, a
+        single squeue call fetches them together with every other unfinished job
+        already in the cache, so monitors sharing this client and polling at the
+        same time are served by one query.
+        
+        Args:
+            job_ids: SLURM job IDs
+            
+        Returns:
+            Dictionary mapping each requested job ID to its job summary
+            
+        Raises:
+            ModelCreationException: If the squeue command fails
+        """
+        with self._jobs_info_lock:
+            return self._get_jobs_info_cached(job_ids)
+    
+    def _get_jobs_info_cached(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Serve job_ids from the cache, querying squeue for the missing ones (caller holds the lock)."""
+        now = time.monotonic()
+        jobs_info = {}
+        for job_id in job_ids:
+            entry = self._jobs_info_cache.get(job_id)
+            if entry is not None and now - entry[0] < self.cache_ttl:
+                jobs_info[job_id] = entry[1]
+        
+        missing_ids = [job_id for job_id in job_ids if job_id not in jobs_info]
+        if missing_ids:
+            tracked_ids = [job_id for job_id, (_, job_summary) in self._jobs_info_cache.items()
+                           if not job_summary['is_finished'] and job_id not in missing_ids]
+            fetched = self._query_jobs_info(missing_ids + tracked_ids)
+            # Rebuilt from this query only, so finished jobs drop out once reported
+            self._jobs_info_cache = {job_id: (now, job_summary) for job_id, job_summary in fetched.items()}
+            for job_id in missing_ids:
+                jobs_info[job_id] = fetched[job_id]
+        
+        return jobs_info
+    
+    def _query_jobs_info(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get job information for many jobs with a single squeue call.
+        
+        Jobs squeue no longer knows about are treated as completed, like in
+        get_job_info. squeue doesn't report exit codes, so failed jobs are
+        re-read with scontrol (while it still has them) for a full error message.
+        
+        Args:
+            job_ids: SLURM job IDs
+            
+        Returns:
+            Dictionary mapping each requested job ID to its job summary
+            
+        Raises:
+            ModelCreationException: If the squeue command fails
+        """
+        if not job_ids:
+            return {}
+        
+        self.logger.debug(f"Getting job information for {len(job_ids)} jobs")
+        stdout, stderr, return_code = self.bash_client.execute_command(
+            ['squeue', '--noheader', '--states=all', '--jobs', ','.join(job_ids), '--format', SQUEUE_JOB_FORMAT]
+        )
+        
+        if return_code != 0:
+            # squeue fails with "Invalid job id specified" when none of the jobs exist anymore
+            if 'invalid job id' not in stderr.lower():
+                error_msg = f"Failed to execute squeue command for jobs {job_ids}: {stderr.strip()}"
+                self.logger.error(error_msg)
+                raise ModelCreationException(error_msg)
+            stdout = ''
+        
+        job_summaries = {}
+        for line in stdout.splitlines():
+            if line.strip():
+                job_summary = extract_job_summary(parse_scontrol_output(line))
+                job_summaries[job_summary['job_id']] = job_summary
+        
+        for job_id in job_ids:
+            job_summary = job_summaries.get(job_id)
+            if job_summary is None:
+                self.logger.info(f"Job {job_id} not found in SLURM queue - treating as completed")
+                job_summaries[job_id] = self._create_completed_job_summary(job_id)
+            elif job_summary['internal_status'] == 'FAILED':
+                detailed_summary = self.get_job_info(job_id)
+                if detailed_summary['state'] != 'NOT_FOUND':
+                    job_summaries[job_id] = detailed_summary
+        
+        return job_summaries
+    
     def is_job_active(self, job_id: str) -> bool:
         """
         Check if job is in an active state (PENDING or RUNNING).
@@ -235,6 +235,15 @@ def extract_job_summary(job_info: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Valid transitions based on the state machine diagram; built once rather than on every call
+_VALID_TRANSITIONS = {
+    'PENDING': frozenset({'RUNNING', 'FAILED'}),        # PENDING can go to RUNNING or FAILED
+    'RUNNING': frozenset({'COMPLETED', 'FAILED'}),      # RUNNING can go to COMPLETED or FAILED
+    'COMPLETED': frozenset(),                           # COMPLETED is terminal
+    'FAILED': frozenset()                               # FAILED is terminal
+}
+
+
 def is_valid_state_transition(current_status: str, new_status: str) -> bool:
     """
     Validate if state transition is allowed according to state machine rules.
@@ -246,21 +255,12 @@ def is_valid_state_transition(current_status: str, new_status: str) -> bool:
     Returns:
         True if transition is valid, False otherwise
     """
-    # Define valid transitions based on state machine diagram
-    valid_transitions = {
-        'PENDING': {'RUNNING', 'FAILED'},           # PENDING can go to RUNNING or FAILED
-        'RUNNING': {'COMPLETED', 'FAILED'},         # RUNNING can go to COMPLETED or FAILED  
-        'COMPLETED': set(),                         # COMPLETED is terminal
-        'FAILED': set()                             # FAILED is terminal
-    }
-    
     # Allow staying in the same state (no transition)
     if current_status == new_status:
         return True
     
     # Check if transition is valid
-    allowed_states = valid_transitions.get(current_status, set())
-    return new_status in allowed_states
+    return new_status in _VALID_TRANSITIONS.get(current_status, ())
 
 
 def should_monitor_job_status(job_status: str) -> bool:
@@ -1,14 +1,14 @@
 """Business logic layer for evaluation management operations."""
 import time
-import traceback
 import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from stroke_seg.bl.template.template_variables import EvaluationTemplateVariables
 from stroke_seg.bl.evaluation.evaluation_facade import EvaluationFacade
 from stroke_seg.config import models_base_path, evaluation_template_path
 from stroke_seg.controller.models import EvaluationConfig
+from stroke_seg.dao.database import CONNECTION_ERRORS, database
 from stroke_seg.dao.job_dao import JobDAO
 from stroke_seg.dao.model_dao import ModelDAO
 from stroke_seg.dao.models import EvaluationRecord, JobRecord
@@ -17,12 +17,23 @@ from stroke_seg.exceptions import (
     ModelNotFoundException,
     InvalidUUIDException,
     InvalidPaginationException,
+    InvalidCursorException,
+    InvalidModelStateException,
+    InvalidStatusException,
     DatabaseException,
     ModelCreationException,
     DatabaseConnectionException
 )
 from stroke_seg.logging_config import get_logger
 
+# Statuses an evaluation may be in when moved to each status; terminal statuses only accept repeats
+ALLOWED_PREVIOUS_STATUSES = {
+    'PENDING': ('PENDING',),
+    'EVALUATING': ('PENDING', 'EVALUATING'),
+    'COMPLETED': ('PENDING', 'EVALUATING', 'COMPLETED'),
+    'FAILED': ('PENDING', 'EVALUATING', 'FAILED'),
+}
+
 
 class EvaluationBL:
     """Business logic class for evaluation management operations."""
@@ -50,13 +61,13 @@ class EvaluationBL:
             ModelCreationException: If evaluation creation fails due to server error
             DatabaseConnectionException: If database connection fails
         """
-        self.logger.info(f"Starting evaluation - Model: {evaluation_conf.model_name}, Configurations: {evaluation_conf.configurations}")
+        self.logger.info("Starting evaluation - Model: %s, Configurations: %s", evaluation_conf.model_name, evaluation_conf.configurations)
         
         try:
             # Find the model by name
             model_record = self.model_dao.get_by_name(evaluation_conf.model_name)
             if not model_record:
-                self.logger.warning(f"Model not found - Name: {evaluation_conf.model_name}")
+                self.logger.warning("Model not found - Name: %s", evaluation_conf.model_name)
                 raise ModelNotFoundException(evaluation_conf.model_name)
             
             # Get model path from training record
@@ -66,46 +77,49 @@ class EvaluationBL:
             # Create output path for evaluation results
             output_path = f"{models_base_path}/{evaluation_conf.model_name}/evaluation/{time.time()}"
             
+            # Copied once; shared by the template variables and the stored record
+            configurations = list(evaluation_conf.configurations)
+            
             # Prepare variables for sbatch template
             evaluation_variables = EvaluationTemplateVariables(
                 model_name=evaluation_conf.model_name,
                 model_path=model_path,
                 evaluation_path=evaluation_conf.evaluation_path,
-                configurations=list(evaluation_conf.configurations),
+                configurations=configurations,
                 output_path=output_path
             )
             
             # Submit job to Singularity via sbatch
             sbatch_job_id, sbatch_content = self.evaluation_facade.submit_evaluation_job(evaluation_variables)
 
-            # Create job record first
-            job_record = JobRecord(
-                sbatch_id=sbatch_job_id,
-                job_type='EVALUATION',
-                status='PENDING',
-                sbatch_content=sbatch_content
-            )
-            job_record = self.job_dao.create(job_record)
-
-            # Create evaluation record with reference to job
-            evaluation_record = EvaluationRecord(
-                model_id=model_record,
-                job_id=job_record,
-                evaluation_path=evaluation_conf.evaluation_path,
-                configurations=list(evaluation_conf.configurations),
-                status='PENDING',
-                start_time=datetime.now()
-            )
+            # Create the job and evaluation records in one transaction (single commit)
+            with database.atomic():
+                job_record = JobRecord(
+                    sbatch_id=sbatch_job_id,
+                    job_type='EVALUATION',
+                    status='PENDING',
+                    sbatch_content=sbatch_content
+                )
+                job_record = self.job_dao.create(job_record)
 
-            self.evaluation_dao.create(evaluation_record)
+                # Evaluation record references the job
+                evaluation_record = EvaluationRecord(
+                    model_id=model_record,
+                    job_id=job_record,
+                    evaluation_path=evaluation_conf.evaluation_path,
+                    configurations=configurations,
+                    status='PENDING',
+                    start_time=datetime.now()
+                )
+                self.evaluation_dao.create(evaluation_record)
 
             self.logger.info(
-                f"Evaluation record created - ID: {evaluation_record.id}, Model: {evaluation_conf.model_name}",
+                "Evaluation record created - ID: %s, Model: %s", evaluation_record.id, evaluation_conf.model_name,
                 extra={'evaluation_id': str(evaluation_record.id)}
             )
 
             self.logger.info(
-                f"Evaluation job submitted - Evaluation ID: {evaluation_record.id}, Job ID: {sbatch_job_id}",
+                "Evaluation job submitted - Evaluation ID: %s, Job ID: %s", evaluation_record.id, sbatch_job_id,
                 extra={'evaluation_id': str(evaluation_record.id), 'job_id': sbatch_job_id}
             )
             
@@ -118,11 +132,9 @@ class EvaluationBL:
         except ModelNotFoundException:
             raise
         except Exception as e:
-            error_msg = str(e).lower()
-            self.logger.error(f"Evaluation failed - Model: {evaluation_conf.model_name}, Error: {str(e)}")
-            self.logger.error(traceback.format_exc())
+            self.logger.error("Evaluation failed - Model: %s, Error: %s", evaluation_conf.model_name, e, exc_info=True)
 
-            if "connection" in error_msg or "connect" in error_msg:
+            if isinstance(e, CONNECTION_ERRORS):
                 raise DatabaseConnectionException(f"Database connection failed: {str(e)}")
             else:
                 raise ModelCreationException(f"Failed to create evaluation: {str(e)}")
@@ -141,22 +153,22 @@ class EvaluationBL:
             InvalidUUIDException: If evaluation ID format is invalid
             ModelNotFoundException: If evaluation is not found
         """
-        self.logger.debug(f"Getting evaluation status - ID: {evaluation_id}")
+        self.logger.debug("Getting evaluation status - ID: %s", evaluation_id)
         
         try:
             evaluation_uuid = uuid.UUID(evaluation_id)
         except (ValueError, TypeError):
-            self.logger.warning(f"Invalid UUID format for evaluation ID: {evaluation_id}")
+            self.logger.warning("Invalid UUID format for evaluation ID: %s", evaluation_id)
             raise InvalidUUIDException("evaluation ID")
         
         evaluation_record = self.evaluation_dao.get_by_id(evaluation_uuid)
         
         if not evaluation_record:
-            self.logger.warning(f"Evaluation not found - ID: {evaluation_id}")
+            self.logger.warning("Evaluation not found - ID: %s", evaluation_id)
             raise ModelNotFoundException(evaluation_id)
         
         self.logger.debug(
-            f"Evaluation status retrieved - ID: {evaluation_id}, Status: {evaluation_record.status}",
+            "Evaluation status retrieved - ID: %s, Status: %s", evaluation_id, evaluation_record.status,
             extra={'evaluation_id': evaluation_id}
         )
         
@@ -170,9 +182,9 @@ class EvaluationBL:
         }
         
         if evaluation_record.start_time:
-            response["startTime"] = evaluation_record.start_time.isoformat() + 'Z'
+            response["startTime"] = evaluation_record.start_time
         if evaluation_record.end_time:
-            response["endTime"] = evaluation_record.end_time.isoformat() + 'Z'
+            response["endTime"] = evaluation_record.end_time
         if evaluation_record.error_message:
             response["errorMessage"] = evaluation_record.error_message
         if evaluation_record.results:
@@ -180,52 +192,68 @@ class EvaluationBL:
             
         return response
     
-    def list_evaluations(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+    def list_evaluations(self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all evaluations with pagination.
         
         Args:
             limit: Maximum number of evaluations to return
-            offset: Number of evaluations to skip
+            offset: Number of evaluations to skip (deprecated, ignored when cursor is given)
+            cursor: Evaluation ID of the last item of the previous page (keyset pagination)
             
         Returns:
             List of evaluation summary dictionaries
             
         Raises:
             InvalidPaginationException: If pagination parameters are invalid
+            InvalidUUIDException: If cursor format is invalid
+            InvalidCursorException: If the cursor evaluation doesn't exist
             DatabaseException: If database operation fails
             DatabaseConnectionException: If database connection fails
         """
-        self.logger.debug(f"Listing evaluations - Limit: {limit}, Offset: {offset}")
+        self.logger.debug("Listing evaluations - Limit: %s, Offset: %s", limit, offset)
         
         if limit < 0:
-            self.logger.warning(f"Invalid limit parameter: {limit}")
+            self.logger.warning("Invalid limit parameter: %s", limit)
             raise InvalidPaginationException("Limit")
         if offset < 0:
-            self.logger.warning(f"Invalid offset parameter: {offset}")
+            self.logger.warning("Invalid offset parameter: %s", offset)
             raise InvalidPaginationException("Offset")
         
+        cursor_uuid = None
+        if cursor:
+            try:
+                cursor_uuid = uuid.UUID(cursor)
+            except (ValueError, TypeError):
+                self.logger.warning("Invalid UUID format for cursor: %s", cursor)
+                raise InvalidUUIDException("cursor")
+        
         try:
-            evaluations = self.evaluation_dao.list_all(limit=limit, offset=offset)
+            evaluations = self.evaluation_dao.list_summaries(limit=limit, offset=offset, cursor_uuid=cursor_uuid)
+            if evaluations is None:
+                self.logger.warning("Cursor evaluation not found: %s", cursor)
+                raise InvalidCursorException(cursor)
             
-            response = []
-            for evaluation in evaluations:
-                response.append({
-                    "evaluationId": str(evaluation.id),
-                    "modelName": evaluation.model_id.model_name,
-                    "evaluationPath": evaluation.evaluation_path,
-                    "status": evaluation.status,
-                    "configurations": evaluation.configurations,
-                    "createdAt": evaluation.created_at.isoformat() + 'Z' if evaluation.created_at else None
-                })
+            response = [
+                {
+                    "evaluationId": evaluation['id'],
+                    "modelName": evaluation['model_name'],
+                    "evaluationPath": evaluation['evaluation_path'],
+                    "status": evaluation['status'],
+                    "configurations": evaluation['configurations'],
+                    "createdAt": evaluation['created_at']
+                }
+                for evaluation in evaluations
+            ]
             
-            self.logger.info(f"Evaluations listed successfully - Count: {len(response)}, Limit: {limit}, Offset: {offset}")
+            self.logger.info("Evaluations listed successfully - Count: %s, Limit: %s, Offset: %s", len(response), limit, offset)
             return response
             
+        except InvalidCursorException:
+            raise
         except Exception as e:
-            error_msg = str(e).lower()
-            self.logger.error(f"Failed to list evaluations - Error: {str(e)}")
-            if "connection" in error_msg or "connect" in error_msg:
+            self.logger.error("Failed to list evaluations - Error: %s", e)
+            if isinstance(e, CONNECTION_ERRORS):
                 raise DatabaseConnectionException(f"Database connection failed: {str(e)}")
             else:
                 raise DatabaseException(f"Failed to list evaluations: {str(e)}")
@@ -246,14 +274,21 @@ class EvaluationBL:
             
         Raises:
             InvalidUUIDException: If evaluation ID format is invalid
+            InvalidStatusException: If status is not a known evaluation status
             ModelNotFoundException: If evaluation is not found
+            InvalidModelStateException: If the evaluation can't move to the status from its current one
         """
-        self.logger.debug(f"Updating evaluation status - ID: {evaluation_id}, Status: {status}")
+        self.logger.debug("Updating evaluation status - ID: %s, Status: %s", evaluation_id, status)
+        
+        allowed_statuses = ALLOWED_PREVIOUS_STATUSES.get(status)
+        if allowed_statuses is None:
+            self.logger.warning("Invalid evaluation status requested - ID: %s, Status: %s", evaluation_id, status)
+            raise InvalidStatusException(status, list(ALLOWED_PREVIOUS_STATUSES))
         
         try:
             evaluation_uuid = uuid.UUID(evaluation_id)
         except (ValueError, TypeError):
-            self.logger.warning(f"Invalid UUID format for evaluation ID: {evaluation_id}")
+            self.logger.warning("Invalid UUID format for evaluation ID: %s", evaluation_id)
             raise InvalidUUIDException("evaluation ID")
         
         update_data = {"status": status}
@@ -264,14 +299,20 @@ class EvaluationBL:
         if status in ['COMPLETED', 'FAILED']:
             update_data["end_time"] = datetime.now()
         
-        evaluation_record = self.evaluation_dao.update(evaluation_uuid, **update_data)
+        evaluation_record = self.evaluation_dao.update_status(evaluation_uuid, allowed_statuses, **update_data)
         
         if not evaluation_record:
-            self.logger.warning(f"Evaluation not found for update - ID: {evaluation_id}")
-            raise ModelNotFoundException(evaluation_id)
+            # Nothing matched: tell a missing evaluation apart from a disallowed transition
+            current_record = self.evaluation_dao.get_by_id(evaluation_uuid)
+            if not current_record:
+                self.logger.warning("Evaluation not found for update - ID: %s", evaluation_id)
+                raise ModelNotFoundException(evaluation_id)
+            self.logger.warning("Invalid evaluation status transition - ID: %s, %s -> %s",
+                                evaluation_id, current_record.status, status)
+            raise InvalidModelStateException(current_record.status, list(allowed_statuses))
         
         self.logger.info(
-            f"Evaluation status updated - ID: {evaluation_id}, Status: {status}",
+            "Evaluation status updated - ID: %s, Status: %s", evaluation_id, status,
             extra={'evaluation_id': evaluation_id}
         )
         
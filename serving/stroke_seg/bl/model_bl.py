@@ -2,14 +2,16 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
+from stroke_seg.dao.database import CONNECTION_ERRORS
 from stroke_seg.dao.model_dao import ModelDAO
 from stroke_seg.dao.models import ModelRecord, TrainingRecord
 from stroke_seg.exceptions import (
     ModelNotFoundException,
     InvalidUUIDException,
     InvalidPaginationException,
+    InvalidCursorException,
     DatabaseException,
     ModelCreationException,
     DatabaseConnectionException
@@ -73,9 +75,8 @@ class ModelBL:
             }
             
         except Exception as e:
-            error_msg = str(e).lower()
             self.logger.error(f"Model creation failed - Name: {model_name}, Error: {str(e)}")
-            if "connection" in error_msg or "connect" in error_msg:
+            if isinstance(e, CONNECTION_ERRORS):
                 raise DatabaseConnectionException(f"Database connection failed: {str(e)}")
             else:
                 raise ModelCreationException(f"Failed to create model: {str(e)}")
@@ -122,31 +123,34 @@ class ModelBL:
             "modelName": model_record.model_name,
             "status": training_record.status,
             "progress": training_record.progress,
-            "createdAt": model_record.created_at.isoformat() + 'Z' if model_record.created_at else None
+            "createdAt": model_record.created_at
         }
         
         if training_record.start_time:
-            response["startTime"] = training_record.start_time.isoformat() + 'Z'
+            response["startTime"] = training_record.start_time
         if training_record.end_time:
-            response["endTime"] = training_record.end_time.isoformat() + 'Z'
+            response["endTime"] = training_record.end_time
         if training_record.error_message:
             response["errorMessage"] = training_record.error_message
             
         return response
     
-    def list_models(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+    def list_models(self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all trained models with pagination.
         
         Args:
             limit: Maximum number of models to return
-            offset: Number of models to skip
+            offset: Number of models to skip (deprecated, ignored when cursor is given)
+            cursor: Model ID of the last item of the previous page (keyset pagination)
             
         Returns:
             List of model summary dictionaries
             
         Raises:
             InvalidPaginationException: If pagination parameters are invalid
+            InvalidUUIDException: If cursor format is invalid
+            InvalidCursorException: If the cursor model doesn't exist
             DatabaseException: If database operation fails
             DatabaseConnectionException: If database connection fails
         """
@@ -159,25 +163,38 @@ class ModelBL:
             self.logger.warning(f"Invalid offset parameter: {offset}")
             raise InvalidPaginationException("Offset")
         
+        cursor_uuid = None
+        if cursor:
+            try:
+                cursor_uuid = uuid.UUID(cursor)
+            except (ValueError, TypeError):
+                self.logger.warning(f"Invalid UUID format for cursor: {cursor}")
+                raise InvalidUUIDException("cursor")
+        
         try:
-            models = self.model_dao.list_all(limit=limit, offset=offset)
+            models = self.model_dao.list_summaries(limit=limit, offset=offset, cursor_uuid=cursor_uuid)
+            if models is None:
+                self.logger.warning(f"Cursor model not found: {cursor}")
+                raise InvalidCursorException(cursor)
             
-            response = []
-            for model in models:
-                response.append({
-                    "modelId": str(model.id),
-                    "modelName": model.model_name,
-                    "status": model.training_id.status,  # Fix: Use 'status' instead of 'trainingStatus'
-                    "createdAt": model.created_at.isoformat() + 'Z' if model.created_at else None
-                })
+            response = [
+                {
+                    "modelId": model['id'],
+                    "modelName": model['model_name'],
+                    "status": model['status'],  # Training status
+                    "createdAt": model['created_at']
+                }
+                for model in models
+            ]
             
             self.logger.info(f"Models listed successfully - Count: {len(response)}, Limit: {limit}, Offset: {offset}")
             return response
             
+        except InvalidCursorException:
+            raise
         except Exception as e:
-            error_msg = str(e).lower()
             self.logger.error(f"Failed to list models - Error: {str(e)}")
-            if "connection" in error_msg or "connect" in error_msg:
+            if isinstance(e, CONNECTION_ERRORS):
                 raise DatabaseConnectionException(f"Database connection failed: {str(e)}")
             else:
                 raise DatabaseException(f"Failed to list models: {str(e)}")
@@ -1,7 +1,9 @@
 """Base abstract class for job monitoring services."""
 
 import asyncio
+import math
 import os
+import time
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -10,18 +12,25 @@ from typing import List, Optional
 from stroke_seg.bl.client.slurm.slurm_client import SlurmClient
 from stroke_seg.bl.client.slurm.slurm_parser import (
     is_valid_state_transition,
-    should_monitor_job_status,
     get_state_transition_reason
 )
-from stroke_seg.dao.database import database
+from stroke_seg.dao.database import CONNECTION_ERRORS, database
 from stroke_seg.dao.job_dao import JobDAO
 from stroke_seg.dao.models import JobRecord
 from stroke_seg.logging_config import get_logger
 
 
+# Seconds a successful connection check is trusted before _ensure_database_connection pings again
+DB_CHECK_INTERVAL = 60
+
+
 class BaseJobMonitor(ABC):
     """Abstract base class for job monitoring services."""
 
+    # Monotonic time of the last successful connection check. Shared by all monitors:
+    # they run on the poller thread and therefore use the same peewee connection.
+    _last_connection_check = 0.0
+
     def __init__(
         self,
         job_dao: Optional[JobDAO] = None,
@@ -37,15 +46,23 @@ class BaseJobMonitor(ABC):
             slurm_client: SlurmClient instance (creates new one if None)
             poll_interval: Polling interval in seconds (default from env or 30)
             job_type: Type of jobs this monitor handles (e.g., 'TRAINING', 'INFERENCE')
+
+        Raises:
+            ValueError: If the polling interval is not positive
         """
         self.logger = get_logger(__name__)
+        self.poll_interval = (poll_interval if poll_interval is not None
+                              else int(os.getenv('SLURM_POLL_INTERVAL', '30')))
+        if self.poll_interval <= 0:
+            # The poll schedule divides by the interval, and a zero interval would poll back to back
+            raise ValueError(f"Polling interval must be a positive number of seconds, got {self.poll_interval}")
         self.job_dao = job_dao or JobDAO()
         self.slurm_client = slurm_client or SlurmClient()
-        self.poll_interval = poll_interval or int(os.getenv('SLURM_POLL_INTERVAL', '30'))
         self.job_type = job_type
 
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._next_run = 0.0
 
         self.logger.info(f"{self.__class__.__name__} initialized with {self.poll_interval}s polling interval")
 
@@ -105,10 +122,12 @@ class BaseJobMonitor(ABC):
         """Main polling loop."""
         self.logger.info(f"{self.__class__.__name__} polling loop started")
 
+        loop = asyncio.get_running_loop()
+        self._next_run = loop.time()
         while self._running:
             try:
                 await self._poll_active_jobs()
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(self._delay_until_next_cycle(loop))
 
             except asyncio.CancelledError:
                 self.logger.info(f"{self.__class__.__name__} polling loop cancelled")
@@ -116,26 +135,55 @@ class BaseJobMonitor(ABC):
             except Exception as e:
                 self.logger.error(f"Error in polling loop: {str(e)}", exc_info=True)
 
-                # Check if it's a database-related error and try to recover
-                if "database" in str(e).lower() or "connection" in str(e).lower():
+                # Check if it's a database connection error and try to recover
+                if isinstance(e, CONNECTION_ERRORS):
                     self.logger.warning("Database error detected, attempting to reconnect...")
                     try:
-                        self._ensure_database_connection()
+                        self._ensure_database_connection(force=True)
                         self.logger.info("Database reconnection successful")
                     except Exception as reconnect_error:
                         self.logger.error(f"Failed to reconnect database: {str(reconnect_error)}")
 
                 # Continue polling even if there's an error
-                await asyncio.sleep(self.poll_interval)
+                await asyncio.sleep(self._delay_until_next_cycle(loop))
 
         self.logger.info(f"{self.__class__.__name__} polling loop ended")
 
-    def _ensure_database_connection(self) -> None:
+    def _delay_until_next_cycle(self, loop: asyncio.AbstractEventLoop) -> float:
+        """
+        Advance the poll schedule by one interval and return the seconds left until it.
+
+        Cycles are scheduled from when the previous one was due to start rather than
+        from when it finished, so the time spent polling doesn't accumulate as drift.
+        A cycle that overruns skips the slots it missed instead of polling back to back.
+
+        Args:
+            loop: The running event loop, whose monotonic clock the schedule uses
+
+        Returns:
+            Seconds to sleep before the next cycle
+        """
+        self._next_run += self.poll_interval
+        now = loop.time()
+        if self._next_run < now:
+            self._next_run += math.ceil((now - self._next_run) / self.poll_interval) * self.poll_interval
+        return self._next_run - now
+
+    def _ensure_database_connection(self, force: bool = False) -> None:
         """
         Ensure database connection is available in the current thread.
 
         This is critical for the poller thread which runs separately from Flask.
+        An open connection is only pinged if it hasn't been checked in the last
+        DB_CHECK_INTERVAL seconds, unless force is set.
+
+        Args:
+            force: Ping an open connection even if it was checked recently
         """
+        if (not force and not database.is_closed()
+                and time.monotonic() - BaseJobMonitor._last_connection_check < DB_CHECK_INTERVAL):
+            return
+
         try:
             if database.is_closed():
                 self.logger.debug("Database connection closed, reconnecting...")
@@ -144,6 +192,7 @@ class BaseJobMonitor(ABC):
             else:
                 # Test the connection to make sure it's still valid
                 database.execute_sql("SELECT 1")
+            BaseJobMonitor._last_connection_check = time.monotonic()
 
         except Exception as e:
             self.logger.warning(f"Database connection issue in poller thread: {str(e)}")
@@ -152,6 +201,7 @@ class BaseJobMonitor(ABC):
                 if not database.is_closed():
                     database.close()
                 database.connect()
+                BaseJobMonitor._last_connection_check = time.monotonic()
                 self.logger.info("Database reconnected successfully in poller thread")
             except Exception as reconnect_error:
                 self.logger.error(f"Failed to reconnect database in poller thread: {str(reconnect_error)}")
@@ -162,6 +212,9 @@ class BaseJobMonitor(ABC):
         """
         Get list of jobs this monitor should handle.
 
+        Only jobs in monitorable (non-terminal) states should be returned; the
+        status filter belongs in the query, not in the poll loop.
+
         Returns:
             List of JobRecord instances to monitor
         """
@@ -173,24 +226,26 @@ class BaseJobMonitor(ABC):
             # Ensure database connection is available in this thread
             self._ensure_database_connection()
 
-            # Get jobs this monitor should handle
-            jobs_to_monitor = self._get_jobs_to_monitor()
-
-            # Filter jobs to only monitor those in monitorable states (state machine requirement)
-            monitorable_jobs = [job for job in jobs_to_monitor if should_monitor_job_status(job.status)]
+            # Get jobs this monitor should handle; the DAO already restricts them to monitorable states
+            monitorable_jobs = self._get_jobs_to_monitor()
 
             if not monitorable_jobs:
                 self.logger.debug("No monitorable jobs to poll")
-                if jobs_to_monitor:
-                    self.logger.debug(f"Skipped {len(jobs_to_monitor) - len(monitorable_jobs)} jobs in terminal states")
                 return
 
-            self.logger.info(f"Polling {len(monitorable_jobs)} monitorable jobs (filtered from {len(jobs_to_monitor)} active jobs)")
+            self.logger.info(f"Polling {len(monitorable_jobs)} monitorable jobs")
+
+            # Fetch SLURM information for all jobs at once instead of one query per job. The squeue
+            # subprocess runs in a worker thread so the event loop (other monitors, stop()) isn't blocked;
+            # DAO calls stay on this thread, which owns the poller's database connection.
+            jobs_info = await asyncio.to_thread(
+                self.slurm_client.get_jobs_info, [job.sbatch_id for job in monitorable_jobs]
+            )
 
             # Process each monitorable job
             for job in monitorable_jobs:
                 try:
-                    await self._update_job_status(job)
+                    await self._update_job_status(job, jobs_info.get(job.sbatch_id))
                 except Exception as e:
                     self.logger.error(f"Failed to update job {job.id} (sbatch_id: {job.sbatch_id}): {str(e)}", exc_info=True)
                     # Continue with other jobs even if one fails
@@ -198,19 +253,20 @@ class BaseJobMonitor(ABC):
 
         except Exception as e:
             self.logger.error(f"Failed to poll active jobs: {str(e)}", exc_info=True)
+            if isinstance(e, CONNECTION_ERRORS):
+                # Don't trust the last check; ping (and reconnect if needed) on the next poll
+                BaseJobMonitor._last_connection_check = 0.0
             # Don't re-raise - allow polling to continue
 
-    async def _update_job_status(self, job: JobRecord) -> None:
+    async def _update_job_status(self, job: JobRecord, job_info: Optional[dict]) -> None:
         """
         Update status of a single job with state machine validation.
 
         Args:
             job: JobRecord to update
+            job_info: Current job information from SLURM
         """
         try:
-            # Get current job information from SLURM
-            job_info = self.slurm_client.get_job_info(job.sbatch_id)
-
             if not job_info:
                 self.logger.warning(f"No job info returned for job {job.id} (sbatch_id: {job.sbatch_id})")
                 return
@@ -220,6 +276,13 @@ class BaseJobMonitor(ABC):
             slurm_state = job_info.get('state')
             start_time = job_info.get('start_time')
             end_time = job_info.get('end_time')
+            status_changed = current_status != new_status
+
+            # Fast path for the common steady-state poll: nothing to validate or write
+            if not status_changed and not self._should_update_timestamps(job, start_time, end_time):
+                self.logger.debug("No updates needed for job %s - status unchanged: %s", job.id, current_status)
+                return
+
             is_finished = job_info.get('is_finished', False)
             error_message = job_info.get('error_message')
 
@@ -228,8 +291,8 @@ class BaseJobMonitor(ABC):
                 self.logger.info(f"Job {job.id} (sbatch_id: {job.sbatch_id}) no longer in SLURM queue - "
                                f"marking as completed (was {current_status})")
 
-            self.logger.debug(f"Job {job.id} (sbatch_id: {job.sbatch_id}) - SLURM state: {slurm_state}, "
-                             f"Current status: {current_status}, New status: {new_status}")
+            self.logger.debug("Job %s (sbatch_id: %s) - SLURM state: %s, Current status: %s, New status: %s",
+                              job.id, job.sbatch_id, slurm_state, current_status, new_status)
 
             # Validate state transition
             if not is_valid_state_transition(current_status, new_status):
@@ -237,25 +300,18 @@ class BaseJobMonitor(ABC):
                                 f"SLURM state: {slurm_state}. Skipping update.")
                 return
 
-            # Check if status has changed or timestamps need updating
-            status_changed = current_status != new_status
-            timestamps_need_update = self._should_update_timestamps(job, start_time, end_time)
-
-            if status_changed or timestamps_need_update:
-                # Delegate to subclass for job-specific handling
-                success = await self._handle_job_update(job, job_info, current_status, new_status)
+            # Delegate to subclass for job-specific handling
+            success = await self._handle_job_update(job, job_info, current_status, new_status)
 
-                if success:
-                    if status_changed:
-                        transition_reason = get_state_transition_reason(current_status, new_status, job_info)
-                        self.logger.info(f"Job {job.id} (sbatch_id: {job.sbatch_id}) - {transition_reason}")
+            if success:
+                if status_changed:
+                    transition_reason = get_state_transition_reason(current_status, new_status, job_info)
+                    self.logger.info(f"Job {job.id} (sbatch_id: {job.sbatch_id}) - {transition_reason}")
 
-                    if is_finished:
-                        self.logger.info(f"Job {job.id} reached terminal state: {new_status}")
-                else:
-                    self.logger.error(f"Failed to handle job update for {job.id}")
+                if is_finished:
+                    self.logger.info(f"Job {job.id} reached terminal state: {new_status}")
             else:
-                self.logger.debug(f"No updates needed for job {job.id} - status unchanged: {current_status}")
+                self.logger.error(f"Failed to handle job update for {job.id}")
 
         except Exception as e:
             # Log error but don't re-raise to avoid stopping the polling of other jobs
@@ -309,7 +365,7 @@ class BaseJobMonitor(ABC):
                 self.logger.warning(f"Job {job_id} not found")
                 return None
 
-            job_info = self.slurm_client.get_job_info(job.sbatch_id)
+            job_info = await asyncio.to_thread(self.slurm_client.get_job_info, job.sbatch_id)
             return job_info
 
         except ValueError as e:
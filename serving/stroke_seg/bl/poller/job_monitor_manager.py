@@ -30,7 +30,8 @@ class JobMonitorManager:
         """
         self.logger = get_logger(__name__)
 
-        # Initialize all monitors with shared dependencies
+        # Initialize all monitors with shared dependencies; a single SlurmClient lets them share its job info cache
+        slurm_client = slurm_client or SlurmClient()
         self.training_monitor = TrainingJobMonitor(job_dao, slurm_client, poll_interval)
         self.prediction_monitor = PredictionJobMonitor(job_dao, slurm_client, poll_interval)
         self.evaluation_monitor = EvaluationJobMonitor(job_dao, slurm_client, poll_interval)
@@ -1,6 +1,5 @@
 """Prediction job monitoring service."""
 
-import uuid
 from typing import List, Optional
 
 from stroke_seg.bl.client.slurm.slurm_client import SlurmClient
@@ -35,9 +34,7 @@ class PredictionJobMonitor(BaseJobMonitor):
 
     def _get_jobs_to_monitor(self) -> List[JobRecord]:
         """Get list of prediction jobs to monitor."""
-        # Get all active jobs and filter for inference jobs
-        all_active_jobs = self.job_dao.get_active_jobs()
-        return [job for job in all_active_jobs if job.job_type == 'INFERENCE']
+        return self.job_dao.get_active_jobs_by_type('INFERENCE')
 
     async def _handle_job_update(self, job: JobRecord, job_info: dict, current_status: str, new_status: str) -> bool:
         """
@@ -77,7 +74,6 @@ class PredictionJobMonitor(BaseJobMonitor):
             True if transaction completed successfully, False otherwise
         """
         try:
-            job_uuid = uuid.UUID(job.id)
             start_time = job_info.get('start_time')
             end_time = job_info.get('end_time')
 
@@ -89,23 +85,22 @@ class PredictionJobMonitor(BaseJobMonitor):
                 if end_time and not job.end_time:
                     job_update_data['end_time'] = end_time
 
-                updated_job = self.job_dao.update(job_uuid, **job_update_data)
+                updated_job = self.job_dao.update(job.id, **job_update_data)
                 if not updated_job:
                     self.logger.error(f"Failed to update job {job.id} to COMPLETED")
                     return False
 
                 # Find and update corresponding inference record
-                inference = self.inference_dao.get_by_job_id(job_uuid)
+                inference = self.inference_dao.get_by_job_id(job.id)
                 if not inference:
                     self.logger.error(f"No inference record found for completed job {job.id}")
                     return False
 
-                inference_uuid = uuid.UUID(inference.predict_id)
                 inference_update_data = {'status': 'COMPLETED'}
                 if end_time:
                     inference_update_data['end_time'] = end_time
 
-                updated_inference = self.inference_dao.update(inference_uuid, **inference_update_data)
+                updated_inference = self.inference_dao.update(inference.predict_id, **inference_update_data)
                 if not updated_inference:
                     self.logger.error(f"Failed to update inference {inference.predict_id} to COMPLETED")
                     return False
@@ -131,7 +126,6 @@ class PredictionJobMonitor(BaseJobMonitor):
             True if transaction completed successfully, False otherwise
         """
         try:
-            job_uuid = uuid.UUID(job.id)
             start_time = job_info.get('start_time')
             end_time = job_info.get('end_time')
             error_message = job_info.get('error_message')
@@ -146,25 +140,24 @@ class PredictionJobMonitor(BaseJobMonitor):
                 if error_message:
                     job_update_data['error_message'] = error_message
 
-                updated_job = self.job_dao.update(job_uuid, **job_update_data)
+                updated_job = self.job_dao.update(job.id, **job_update_data)
                 if not updated_job:
                     self.logger.error(f"Failed to update job {job.id} to FAILED")
                     return False
 
                 # Find and update corresponding inference record
-                inference = self.inference_dao.get_by_job_id(job_uuid)
+                inference = self.inference_dao.get_by_job_id(job.id)
                 if not inference:
                     self.logger.error(f"No inference record found for failed job {job.id}")
                     return False
 
-                inference_uuid = uuid.UUID(inference.predict_id)
                 inference_update_data = {'status': 'FAILED'}
                 if end_time:
                     inference_update_data['end_time'] = end_time
                 if error_message:
                     inference_update_data['error_message'] = error_message
 
-                updated_inference = self.inference_dao.update(inference_uuid, **inference_update_data)
+                updated_inference = self.inference_dao.update(inference.predict_id, **inference_update_data)
                 if not updated_inference:
                     self.logger.error(f"Failed to update inference {inference.predict_id} to FAILED")
                     return False
@@ -216,8 +209,7 @@ class PredictionJobMonitor(BaseJobMonitor):
                 self.logger.warning(f"Prediction job {job.id} failed: {error_message}")
 
             # Update job record in database
-            job_uuid = uuid.UUID(job.id)
-            updated_job = self.job_dao.update(job_uuid, **update_data)
+            updated_job = self.job_dao.update(job.id, **update_data)
 
             if updated_job:
                 self.logger.debug(f"Prediction job {job.id} updated successfully to status: {new_status}")
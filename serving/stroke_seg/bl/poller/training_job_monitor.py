@@ -1,6 +1,5 @@
 """Training job monitoring service."""
 
-import uuid
 from datetime import datetime
 from typing import List, Optional
 
@@ -38,9 +37,7 @@ class TrainingJobMonitor(BaseJobMonitor):
 
     def _get_jobs_to_monitor(self) -> List[JobRecord]:
         """Get list of training jobs to monitor."""
-        # Get all active jobs and filter for training jobs
-        all_active_jobs = self.job_dao.get_active_jobs()
-        return [job for job in all_active_jobs if job.job_type == 'TRAINING']
+        return self.job_dao.get_active_jobs_by_type('TRAINING')
 
     async def _handle_job_update(self, job: JobRecord, job_info: dict, current_status: str, new_status: str) -> bool:
         """
@@ -76,7 +73,6 @@ class TrainingJobMonitor(BaseJobMonitor):
             True if transaction completed successfully, False otherwise
         """
         try:
-            job_uuid = uuid.UUID(job.id)
             start_time = job_info.get('start_time')
             end_time = job_info.get('end_time')
 
@@ -88,23 +84,22 @@ class TrainingJobMonitor(BaseJobMonitor):
                 if end_time and not job.end_time:
                     job_update_data['end_time'] = end_time
 
-                updated_job = self.job_dao.update(job_uuid, **job_update_data)
+                updated_job = self.job_dao.update(job.id, **job_update_data)
                 if not updated_job:
                     self.logger.error(f"Failed to update job {job.id} to COMPLETED")
                     return False
 
                 # Find and update corresponding training record
-                training = self.training_dao.get_by_job_id(job_uuid)
+                training = self.training_dao.get_by_job_id(job.id)
                 if not training:
                     self.logger.error(f"No training record found for completed job {job.id}")
                     return False
 
-                training_uuid = uuid.UUID(training.id)
                 training_update_data = {'status': 'TRAINED'}
                 if end_time:
                     training_update_data['end_time'] = end_time
 
-                updated_training = self.training_dao.update(training_uuid, **training_update_data)
+                updated_training = self.training_dao.update(training.id, **training_update_data)
                 if not updated_training:
                     self.logger.error(f"Failed to update training {training.id} to TRAINED")
                     return False
@@ -168,8 +163,7 @@ class TrainingJobMonitor(BaseJobMonitor):
                 self.logger.warning(f"Training job {job.id} failed: {error_message}")
 
             # Update job record in database
-            job_uuid = uuid.UUID(job.id)
-            updated_job = self.job_dao.update(job_uuid, **update_data)
+            updated_job = self.job_dao.update(job.id, **update_data)
 
             if updated_job:
                 self.logger.debug(f"Training job {job.id} updated successfully to status: {new_status}")
@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from stroke_seg.controller.models import InferenceInput
 from stroke_seg.config import inference_template_path
@@ -18,6 +18,7 @@ from stroke_seg.exceptions import (
     PredictionNotFoundException,
     InvalidUUIDException,
     InvalidPaginationException,
+    InvalidCursorException,
     DatabaseException
 )
 
@@ -104,7 +105,7 @@ class InferenceBL:
                 "predictId": str(inference_record.predict_id),
                 "modelId": str(model_record.id),
                 "batchJobId": sbatch_job_id,
-                "timestamp": inference_record.created_at.isoformat() + 'Z'
+                "timestamp": inference_record.created_at
             }
             
         except Exception as e:
@@ -141,27 +142,39 @@ class InferenceBL:
         }
         
         if inference_record.start_time:
-            response["startTime"] = inference_record.start_time.isoformat() + 'Z'
+            response["startTime"] = inference_record.start_time
         if inference_record.end_time:
-            response["endTime"] = inference_record.end_time.isoformat() + 'Z'
+            response["endTime"] = inference_record.end_time
         if inference_record.error_message:
             response["errorMessage"] = inference_record.error_message
             
         return response
     
-    def list_predictions(self, limit: int = 10, offset: int = 0) -> List[Dict[str, Any]]:
+    def get_predictions_version(self) -> str:
+        """
+        Get a marker that changes whenever any prediction is created or updated.
+        
+        Returns:
+            The prediction change counter, as a string
+        """
+        return str(self.inference_dao.get_version())
+    
+    def list_predictions(self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all predictions with pagination.
         
         Args:
             limit: Maximum number of predictions to return
-            offset: Number of predictions to skip
+            offset: Number of predictions to skip (deprecated, ignored when cursor is given)
+            cursor: Prediction ID of the last item of the previous page (keyset pagination)
             
         Returns:
             List of prediction summary dictionaries
             
         Raises:
             InvalidPaginationException: If pagination parameters are invalid
+            InvalidUUIDException: If cursor format is invalid
+            InvalidCursorException: If the cursor prediction doesn't exist
             DatabaseException: If database operation fails
         """
         if limit < 0:
@@ -169,19 +182,29 @@ class InferenceBL:
         if offset < 0:
             raise InvalidPaginationException("Offset")
         
+        cursor_uuid = None
+        if cursor:
+            try:
+                cursor_uuid = uuid.UUID(cursor)
+            except (ValueError, TypeError):
+                raise InvalidUUIDException("cursor")
+        
         try:
-            predictions = self.inference_dao.list_all(limit=limit, offset=offset)
-            
-            response = []
-            for prediction in predictions:
-                response.append({
-                    "predictId": str(prediction.predict_id),
-                    "modelId": str(prediction.model_id.id),
-                    "status": prediction.status,
-                    "createdAt": prediction.created_at.isoformat() + 'Z'
-                })
+            predictions = self.inference_dao.list_summaries(limit=limit, offset=offset, cursor_uuid=cursor_uuid)
+            if predictions is None:
+                raise InvalidCursorException(cursor)
             
-            return response
+            return [
+                {
+                    "predictId": prediction['predict_id'],
+                    "modelId": prediction['model_id'],
+                    "status": prediction['status'],
+                    "createdAt": prediction['created_at']
+                }
+                for prediction in predictions
+            ]
             
+        except InvalidCursorException:
+            raise
         except Exception as e:
             raise DatabaseException(f"Failed to list predictions: {str(e)}")
\ No newline at end of file
@@ -8,6 +8,9 @@ from stroke_seg.logging_config import get_logger
 from stroke_seg.exceptions import ModelCreationException
 from .template_variables import TrainingTemplateVariables, PredictionTemplateVariables, EvaluationTemplateVariables
 
+# Matches {placeholder} fields in sbatch templates
+PLACEHOLDER_PATTERN = re.compile(r'\{([^}]+)\}')
+
 
 class TemplateGenerator:
     """Handles sbatch template loading and variable interpolation."""
@@ -28,6 +31,8 @@ class TemplateGenerator:
 
         self.logger = get_logger(__name__)
         self.template_content = self._load_template(template_path)
+        # The template doesn't change after loading, so its placeholders are extracted once
+        self.placeholders = tuple(dict.fromkeys(PLACEHOLDER_PATTERN.findall(self.template_content)))
 
     def _load_template(self, template_path : str) -> str:
         """
@@ -77,11 +82,8 @@ class TemplateGenerator:
             # Convert dataclass to dict for formatting
             variables_dict = variables.to_dict()
             
-            # Find all placeholders in template
-            placeholders = re.findall(r'\{([^}]+)\}', self.template_content)
-            
             # Check if all required variables are provided
-            missing_vars = [var for var in placeholders if var not in variables_dict]
+            missing_vars = [var for var in self.placeholders if var not in variables_dict]
             if missing_vars:
                 error_msg = f"Missing template variables: {missing_vars}"
                 self.logger.error(error_msg)
@@ -143,11 +145,8 @@ class TemplateGenerator:
         self.logger.debug(f"Generating inference sbatch content with variables: {list(variables_dict.keys())}")
 
         try:
-            # Find all placeholders in template
-            placeholders = re.findall(r'\{([^}]+)\}', self.template_content)
-
             # Check if all required variables are provided
-            missing_vars = [var for var in placeholders if var not in variables_dict]
+            missing_vars = [var for var in self.placeholders if var not in variables_dict]
             if missing_vars:
                 error_msg = f"Missing template variables: {missing_vars}"
                 self.logger.error(error_msg)
@@ -186,11 +185,8 @@ class TemplateGenerator:
         self.logger.debug(f"Generating evaluation sbatch content with variables: {list(variables_dict.keys())}")
 
         try:
-            # Find all placeholders in template
-            placeholders = re.findall(r'\{([^}]+)\}', self.template_content)
-
             # Check if all required variables are provided
-            missing_vars = [var for var in placeholders if var not in variables_dict]
+            missing_vars = [var for var in self.placeholders if var not in variables_dict]
             if missing_vars:
                 error_msg = f"Missing template variables: {missing_vars}"
                 self.logger.error(error_msg)
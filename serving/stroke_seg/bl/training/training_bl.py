@@ -1,6 +1,5 @@
 """Business logic layer for training management operations."""
 import time
-import traceback
 import uuid
 from datetime import datetime
 from typing import List, Dict, Any
@@ -9,6 +8,7 @@ from stroke_seg.bl.training import TrainingTemplateVariables
 from stroke_seg.bl.training.training_facade import ModelTrainingFacade
 from stroke_seg.config import models_base_path, training_template_path
 from stroke_seg.controller.models import TrainingConfig
+from stroke_seg.dao.database import CONNECTION_ERRORS
 from stroke_seg.dao.job_dao import JobDAO
 from stroke_seg.dao.models import TrainingRecord, JobRecord
 from stroke_seg.dao.training_dao import TrainingDAO
@@ -102,11 +102,9 @@ class TrainingBL:
             }
             
         except Exception as e:
-            error_msg = str(e).lower()
-            self.logger.error(f"Training failed - Name: {training_conf.model_name}, Error: {str(e)}")
-            self.logger.error(traceback.format_exc())
+            self.logger.error(f"Training failed - Name: {training_conf.model_name}, Error: {str(e)}", exc_info=True)
 
-            if "connection" in error_msg or "connect" in error_msg:
+            if isinstance(e, CONNECTION_ERRORS):
                 raise DatabaseConnectionException(f"Database connection failed: {str(e)}")
             else:
 
@@ -152,9 +150,9 @@ class TrainingBL:
         }
         
         if training_record.start_time:
-            response["startTime"] = training_record.start_time.isoformat() + 'Z'
+            response["startTime"] = training_record.start_time
         if training_record.end_time:
-            response["endTime"] = training_record.end_time.isoformat() + 'Z'
+            response["endTime"] = training_record.end_time
         if training_record.job_id.error_message:
             response["errorMessage"] = training_record.job_id.error_message
             
@@ -194,16 +192,15 @@ class TrainingBL:
                     "trainingId": str(training.id),
                     "trainingName": training.name,
                     "status": training.status,
-                    "createdAt": training.start_time.isoformat() + 'Z' if training.start_time else None
+                    "createdAt": training.start_time
                 })
             
             self.logger.info(f"Trainings listed successfully - Count: {len(response)}, Limit: {limit}, Offset: {offset}")
             return response
             
         except Exception as e:
-            error_msg = str(e).lower()
             self.logger.error(f"Failed to list trainings - Error: {str(e)}")
-            if "connection" in error_msg or "connect" in error_msg:
+            if isinstance(e, CONNECTION_ERRORS):
                 raise DatabaseConnectionException(f"Database connection failed: {str(e)}")
             else:
                 raise DatabaseException(f"Failed to list trainings: {str(e)}")
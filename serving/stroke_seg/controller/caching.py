@@ -0,0 +1,41 @@
+"""Conditional GET (ETag / If-None-Match) helpers for read-only endpoints."""
+
+import hashlib
+from typing import Optional
+
+from flask import Response, request
+
+
+def version_etag(*version_parts) -> str:
+    """Build an ETag from a data version marker and the request URL, including its query string."""
+    raw = repr((request.full_path,) + version_parts).encode('utf-8')
+    return hashlib.md5(raw).hexdigest()
+
+
+def is_not_modified(etag: str) -> bool:
+    """Check whether the client's If-None-Match already holds this ETag."""
+    return request.if_none_match.contains(etag)
+
+
+def not_modified_response(etag: str) -> Response:
+    """Build an empty 304 response for a client copy that is still current."""
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+def conditional_response(response: Response, etag: Optional[str] = None) -> Response:
+    """
+    Attach an ETag and answer 304 when the client's copy is current.
+
+    Without an explicit etag the response body hash is used, which still saves
+    the transfer. Clients must revalidate on every request (no-cache), so status
+    polling never sees stale data.
+    """
+    if etag:
+        response.set_etag(etag)
+    else:
+        response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
@@ -5,6 +5,7 @@ from pydantic import ValidationError
 
 from stroke_seg.bl.evaluation.evaluation_bl import EvaluationBL
 from stroke_seg.controller.models import EvaluationConfig
+from stroke_seg.controller.pagination import list_response
 from stroke_seg.error_handler import handle_errors
 from stroke_seg.logging_config import get_logger
 
@@ -21,16 +22,16 @@ def run_evaluation():
     try:
         raw_data = request.get_json(force=True)
         evaluation_config: EvaluationConfig = EvaluationConfig.model_validate(raw_data)
-        logger.info(f"Model evaluation requested - Model: {evaluation_config.model_name}, Configurations: {evaluation_config.configurations}")
+        logger.info("Model evaluation requested - Model: %s, Configurations: %s", evaluation_config.model_name, evaluation_config.configurations)
         result = evaluation_bl.run_evaluation(evaluation_config)
-        logger.info(f"Model evaluation initiated - ID: {result.get('evaluationId')}")
+        logger.info("Model evaluation initiated - ID: %s", result.get('evaluationId'))
         return jsonify(result), 202
 
     except ValidationError as e:
-        logger.warning(f"Validation error in run_evaluation: {e}")
+        logger.warning("Validation error in run_evaluation: %s", e)
         raise ValueError(f"Invalid evaluation configuration: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in run_evaluation: {e}")
+        logger.error("Unexpected error in run_evaluation: %s", e)
         raise e
 
 
@@ -38,9 +39,9 @@ def run_evaluation():
 @handle_errors
 def get_evaluation_status(evaluation_id):
     """Get model evaluation status."""
-    logger.info(f"Evaluation status requested - ID: {evaluation_id}")
+    logger.info("Evaluation status requested - ID: %s", evaluation_id)
     result = evaluation_bl.get_evaluation_status(evaluation_id)
-    logger.info(f"Evaluation status retrieved - ID: {evaluation_id}, Status: {result.get('status')}")
+    logger.info("Evaluation status retrieved - ID: %s, Status: %s", evaluation_id, result.get('status'))
     return jsonify(result), 200
 
 
@@ -50,8 +51,9 @@ def list_evaluations():
     """List all evaluations with pagination."""
     limit = request.args.get('limit', 10, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
 
-    logger.debug(f"Evaluations list requested - Limit: {limit}, Offset: {offset}")
-    result = evaluation_bl.list_evaluations(limit=limit, offset=offset)
-    logger.info(f"Evaluations list retrieved - Count: {len(result) if result else 0}")
-    return jsonify(result), 200
+    logger.debug("Evaluations list requested - Limit: %s, Offset: %s, Cursor: %s", limit, offset, cursor)
+    result = evaluation_bl.list_evaluations(limit=limit, offset=offset, cursor=cursor)
+    logger.info("Evaluations list retrieved - Count: %s", len(result) if result else 0)
+    return list_response(result, limit, 'evaluationId'), 200
@@ -3,6 +3,8 @@
 from flask import Blueprint, request, jsonify
 
 from stroke_seg.bl.model_bl import ModelBL
+from stroke_seg.controller.caching import conditional_response
+from stroke_seg.controller.pagination import list_response
 from stroke_seg.error_handler import handle_errors
 from stroke_seg.logging_config import get_logger
 
@@ -15,10 +17,10 @@ model_bp = Blueprint('model', __name__, url_prefix='/api/v1/model')
 @handle_errors
 def get_model_status(model_id):
     """Get model training status."""
-    logger.info(f"Model status requested - ID: {model_id}")
+    logger.info("Model status requested - ID: %s", model_id)
     result = model_bl.get_model_info(model_id)
-    logger.info(f"Model status retrieved - ID: {model_id}, Status: {result.get('status')}")
-    return jsonify(result), 200
+    logger.info("Model status retrieved - ID: %s, Status: %s", model_id, result.get('status'))
+    return conditional_response(jsonify(result))
 
 
 @model_bp.route('/list', methods=['GET'])
@@ -27,8 +29,9 @@ def list_models():
     """List all models with pagination."""
     limit = request.args.get('limit', 10, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
     
-    logger.debug(f"Models list requested - Limit: {limit}, Offset: {offset}")
-    result = model_bl.list_models(limit=limit, offset=offset)
-    logger.info(f"Models list retrieved - Count: {len(result) if result else 0}")
-    return jsonify(result), 200
\ No newline at end of file
+    logger.debug("Models list requested - Limit: %s, Offset: %s, Cursor: %s", limit, offset, cursor)
+    result = model_bl.list_models(limit=limit, offset=offset, cursor=cursor)
+    logger.info("Models list retrieved - Count: %s", len(result) if result else 0)
+    return conditional_response(list_response(result, limit, 'modelId'))
\ No newline at end of file
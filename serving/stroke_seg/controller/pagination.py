@@ -0,0 +1,20 @@
+"""Helpers for paginated list responses."""
+
+from typing import Any, Dict, List
+
+from flask import jsonify
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+def list_response(items: List[Dict[str, Any]], limit: int, id_field: str):
+    """
+    Build a JSON list response carrying the keyset cursor for the next page.
+
+    The body stays a plain list; when the page is full, the ID of its last item
+    is returned in the X-Next-Cursor header to be passed back as ?cursor=.
+    """
+    response = jsonify(items)
+    if items and len(items) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = items[-1][id_field]
+    return response
@@ -3,7 +3,9 @@
 from flask import Blueprint, request, jsonify
 
 from stroke_seg.bl.prediction.inference_bl import InferenceBL
+from stroke_seg.controller.caching import conditional_response, is_not_modified, not_modified_response, version_etag
 from stroke_seg.controller.models import InferenceInput
+from stroke_seg.controller.pagination import list_response
 from stroke_seg.error_handler import handle_errors
 from stroke_seg.logging_config import get_logger
 
@@ -19,9 +21,9 @@ def make_prediction():
     """Make a prediction using a specified model."""
     data = request.get_json(force=True)
     inference_input : InferenceInput = InferenceInput.model_validate(data)
-    logger.info(f"Prediction requested - Model ID: {inference_input.model_id}")
+    logger.info("Prediction requested - Model ID: %s", inference_input.model_id)
     result = inference_bl.make_prediction(inference_input)
-    logger.info(f"Prediction completed - ID: {result.get('predictId')}, Model: {inference_input.model_id}")
+    logger.info("Prediction completed - ID: %s, Model: %s", result.get('predictId'), inference_input.model_id)
     return jsonify(result), 200
 
 
@@ -29,10 +31,10 @@ def make_prediction():
 @handle_errors
 def get_prediction_status(predict_id):
     """Get prediction status."""
-    logger.info(f"Prediction status requested - ID: {predict_id}")
+    logger.info("Prediction status requested - ID: %s", predict_id)
     result = inference_bl.get_prediction_status(predict_id)
-    logger.info(f"Prediction status retrieved - ID: {predict_id}, Status: {result.get('status')}")
-    return jsonify(result), 200
+    logger.info("Prediction status retrieved - ID: %s, Status: %s", predict_id, result.get('status'))
+    return conditional_response(jsonify(result))
 
 
 @prediction_bp.route('/list', methods=['GET'])
@@ -41,8 +43,14 @@ def list_predictions():
     """List all predictions with pagination."""
     limit = request.args.get('limit', 10, type=int)
     offset = request.args.get('offset', 0, type=int)
+    cursor = request.args.get('cursor')
+    
+    etag = version_etag(inference_bl.get_predictions_version())
+    if is_not_modified(etag):
+        logger.debug("Predictions list not modified")
+        return not_modified_response(etag)
     
-    logger.debug(f"Predictions list requested - Limit: {limit}, Offset: {offset}")
-    result = inference_bl.list_predictions(limit=limit, offset=offset)
-    logger.info(f"Predictions list retrieved - Count: {len(result) if result else 0}")
-    return jsonify(result), 200
\ No newline at end of file
+    logger.debug("Predictions list requested - Limit: %s, Offset: %s, Cursor: %s", limit, offset, cursor)
+    result = inference_bl.list_predictions(limit=limit, offset=offset, cursor=cursor)
+    logger.info("Predictions list retrieved - Count: %s", len(result) if result else 0)
+    return conditional_response(list_response(result, limit, 'predictId'), etag)
\ No newline at end of file
@@ -21,16 +21,16 @@ def train_model():
     try:
         raw_data = request.get_json(force=True)
         training_config : TrainingConfig = TrainingConfig.model_validate(raw_data)
-        logger.info(f"Model training requested - Name: {training_config.model_name}")
+        logger.info("Model training requested - Name: %s", training_config.model_name)
         result = training_bl.train_model(training_config)
-        logger.info(f"Model training initiated - ID: {result.get('trainingId')}")
+        logger.info("Model training initiated - ID: %s", result.get('trainingId'))
         return jsonify(result), 202
 
     except ValidationError as e:
-        logger.warning(f"Validation error in train_model: {e}")
+        logger.warning("Validation error in train_model: %s", e)
         raise e(f"Invalid training configuration: {str(e)}")
     except Exception as e:
-        logger.error(f"Unexpected error in train_model: {e}")
+        logger.error("Unexpected error in train_model: %s", e)
         raise e
 
 
@@ -38,9 +38,9 @@ def train_model():
 @handle_errors
 def get_training_status(model_id):
     """Get model training status."""
-    logger.info(f"Training status requested - ID: {model_id}")
+    logger.info("Training status requested - ID: %s", model_id)
     result = training_bl.get_training_status(model_id)
-    logger.info(f"Training status retrieved - ID: {model_id}, Status: {result.get('status')}")
+    logger.info("Training status retrieved - ID: %s, Status: %s", model_id, result.get('status'))
     return jsonify(result), 200
 
 
@@ -51,7 +51,7 @@ def list_trainings():
     limit = request.args.get('limit', 10, type=int)
     offset = request.args.get('offset', 0, type=int)
 
-    logger.debug(f"Trainings list requested - Limit: {limit}, Offset: {offset}")
+    logger.debug("Trainings list requested - Limit: %s, Offset: %s", limit, offset)
     result = training_bl.list_trainings(limit=limit, offset=offset)
-    logger.info(f"Trainings list retrieved - Count: {len(result) if result else 0}")
+    logger.info("Trainings list retrieved - Count: %s", len(result) if result else 0)
     return jsonify(result), 200
\ No newline at end of file
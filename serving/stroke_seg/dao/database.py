@@ -1,9 +1,12 @@
 import os
+import re
 
 from dotenv import load_dotenv
-from peewee import Model
-from playhouse.pool import PooledPostgresqlDatabase
+from peewee import InterfaceError, Model, NotSupportedError, OperationalError
+from playhouse.pool import MaxConnectionsExceeded, PooledPostgresqlDatabase
+from psycopg2 import errorcodes
 
+# Variables already set in the environment take precedence over .env
 load_dotenv()
 
 def get_database_config():
@@ -14,7 +17,7 @@ def get_database_config():
         'database': os.getenv('DB_NAME', 'pic_db'),
         'user': os.getenv('DB_USER', 'pic_user'),
         'password': os.getenv('DB_PASSWORD', 'pic_password'),
-        'max_connections': int(os.getenv('DB_MAX_CONNECTIONS', 5)),
+        'max_connections': int(os.getenv('DB_MAX_CONNECTIONS', 10)),
         'stale_timeout': int(os.getenv('DB_STALE_TIMEOUT', 300)),
         'timeout': int(os.getenv('DB_CONNECTION_TIMEOUT', 10)),
     }
@@ -33,6 +36,67 @@ database = PooledPostgresqlDatabase(
 )
 
 
+# Exceptions meaning the database could not be reached or no pooled connection was available.
+# peewee re-raises psycopg2's OperationalError/InterfaceError as its own classes of the same name.
+CONNECTION_ERRORS = (OperationalError, InterfaceError, MaxConnectionsExceeded)
+
+# Rows per multi-row INSERT statement for DAO bulk_create methods
+BULK_INSERT_BATCH_SIZE = 1000
+
+# Server-side prepared statements for hot read paths are PREPAREd lazily, once per pooled
+# connection, the first time they are executed there. Errors that mean the statement has to be
+# (re-)prepared: not prepared on this connection yet, or its cached plan no longer matches the
+# table (e.g. after a migration changed a selected column's type). psycopg2 raises these as
+# OperationalError and NotSupportedError respectively; peewee re-raises them as its own classes
+# and keeps the psycopg2 error, which carries the SQLSTATE, as .orig.
+_REPREPARE_ERRORS = {
+    errorcodes.INVALID_SQL_STATEMENT_NAME: False,
+    errorcodes.FEATURE_NOT_SUPPORTED: True,
+}
+
+
+def _prepared_statement_sql(query):
+    """
+    Render a peewee query as the body of a PREPARE statement.
+
+    The query's explicit column list is kept, so the statement's result type only changes
+    with the model, and its %s placeholders become the positional $1..$n parameters.
+    """
+    sql, params = query.sql()
+    placeholders = iter(range(1, len(params) + 1))
+    return re.sub(r'%s', lambda _: f"${next(placeholders)}", sql)
+
+
+def execute_prepared(query, name, *params):
+    """
+    Run a prepared statement and hydrate the rows as instances of the query's model.
+
+    Args:
+        query: Peewee query the statement is prepared from; also run directly inside transactions,
+            where a failed EXECUTE would abort them
+        name: Statement name, unique per query
+        *params: Statement parameters
+
+    Returns:
+        List of model instances
+    """
+    if database.in_transaction():
+        return list(query)
+
+    execute_sql = f"EXECUTE {name}({', '.join(['%s'] * len(params))})"
+    try:
+        return list(query.model.raw(execute_sql, *params))
+    except (OperationalError, NotSupportedError) as e:
+        pgcode = getattr(getattr(e, 'orig', None), 'pgcode', None)
+        if pgcode not in _REPREPARE_ERRORS:
+            raise
+        # Autocommit mode means the failed EXECUTE aborted nothing
+        if _REPREPARE_ERRORS[pgcode]:
+            database.execute_sql(f"DEALLOCATE {name}")
+        database.execute_sql(f"PREPARE {name} AS {_prepared_statement_sql(query)}")
+        return list(query.model.raw(execute_sql, *params))
+
+
 def verify_connection():
     """Verify database connection is working."""
     try:
@@ -1,8 +1,9 @@
 """Data Access Object for EvaluationRecord operations."""
 
-from typing import List, Optional
-from peewee import DoesNotExist
-from stroke_seg.dao.models import EvaluationRecord
+from typing import Any, Dict, List, Optional, Sequence, Union
+from datetime import datetime
+from peewee import DoesNotExist, Tuple, fn
+from stroke_seg.dao.models import EvaluationRecord, JobRecord, ModelRecord
 import uuid
 
 
@@ -25,7 +26,7 @@ class EvaluationDAO:
         except DoesNotExist:
             return None
     
-    def get_by_job_id(self, job_uuid: uuid.UUID) -> Optional[EvaluationRecord]:
+    def get_by_job_id(self, job_uuid: Union[uuid.UUID, str]) -> Optional[EvaluationRecord]:
         """Get an evaluation by its job_id."""
         try:
             return EvaluationRecord.get(EvaluationRecord.job_id == str(job_uuid))
@@ -39,21 +40,118 @@ class EvaluationDAO:
             query = query.limit(limit)
         return list(query)
     
+    def list_summaries(self, limit: Optional[int] = None, offset: int = 0,
+                       cursor_uuid: Optional[uuid.UUID] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get evaluation summaries newest first, for list views.
+        
+        Selects only the listed columns plus the model name, returned as dicts
+        without instantiating models; results, error_message and the job are
+        not fetched. Pages after the cursor evaluation when given, otherwise by offset.
+        
+        Returns:
+            The page of summaries, or None if the cursor evaluation doesn't exist (e.g. it was
+            deleted), since no row would compare after it and paging would silently stop
+        """
+        query = (EvaluationRecord
+                 .select(EvaluationRecord.id, EvaluationRecord.evaluation_path, EvaluationRecord.status,
+                         EvaluationRecord.configurations, EvaluationRecord.created_at, ModelRecord.model_name)
+                 .join(ModelRecord)
+                 .order_by(EvaluationRecord.created_at.desc(), EvaluationRecord.id.desc()))
+        if cursor_uuid:
+            query = query.where(self._after_cursor(cursor_uuid))
+        else:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        summaries = list(query.dicts().iterator())
+        # A missing cursor row makes the keyset condition NULL, which only shows as an empty page
+        if cursor_uuid and not summaries and not self._exists(cursor_uuid):
+            return None
+        return summaries
+    
+    @staticmethod
+    def _exists(evaluation_uuid: uuid.UUID) -> bool:
+        """Check whether an evaluation exists."""
+        return EvaluationRecord.select().where(EvaluationRecord.id == str(evaluation_uuid)).exists()
+    
+    @staticmethod
+    def _after_cursor(cursor_uuid: uuid.UUID):
+        """Condition matching evaluations ordered after the cursor evaluation (created_at, id descending)."""
+        cursor_row = (EvaluationRecord.select(EvaluationRecord.created_at, EvaluationRecord.id)
+                      .where(EvaluationRecord.id == str(cursor_uuid)))
+        return Tuple(EvaluationRecord.created_at, EvaluationRecord.id) < cursor_row
+    
     def get_by_status(self, status: str) -> List[EvaluationRecord]:
         """Get all evaluations with a specific status."""
         return list(EvaluationRecord.select().where(EvaluationRecord.status == status))
     
-    def update(self, evaluation_uuid: uuid.UUID, **kwargs) -> Optional[EvaluationRecord]:
-        """Update an evaluation record."""
+    def update(self, evaluation_uuid: Union[uuid.UUID, str], **kwargs) -> Optional[EvaluationRecord]:
+        """Update an evaluation record, writing only the fields whose value changes (no UPDATE if none do)."""
         try:
             evaluation = EvaluationRecord.get(EvaluationRecord.id == str(evaluation_uuid))
+            changed_fields = []
             for key, value in kwargs.items():
-                setattr(evaluation, key, value)
-            evaluation.save()
+                if getattr(evaluation, key) != value:
+                    setattr(evaluation, key, value)
+                    changed_fields.append(getattr(EvaluationRecord, key))
+            if changed_fields:
+                evaluation.save(only=changed_fields)
             return evaluation
         except DoesNotExist:
             return None
     
+    def update_status(self, evaluation_uuid: uuid.UUID, allowed_statuses: Sequence[str],
+                      **kwargs) -> Optional[EvaluationRecord]:
+        """
+        Update an evaluation only if its current status is one of allowed_statuses.
+        
+        Runs a single UPDATE ... RETURNING, so the status check and the write are atomic.
+        Returns the updated record, or None if no evaluation matched (missing or in another status).
+        """
+        query = (EvaluationRecord.update(**kwargs)
+                 .where((EvaluationRecord.id == str(evaluation_uuid)) &
+                        (EvaluationRecord.status.in_(allowed_statuses)))
+                 .returning(EvaluationRecord))
+        return next(iter(query.execute()), None)
+    
+    def finalize_with_job(self, job_uuid: Union[uuid.UUID, str], status: str, start_time: Optional[datetime] = None,
+                          end_time: Optional[datetime] = None,
+                          error_message: Optional[str] = None) -> Optional[EvaluationRecord]:
+        """
+        Move a job and its evaluation to a terminal status in one statement.
+        
+        The job UPDATE runs in a data-modifying CTE whose RETURNING feeds the evaluation
+        UPDATE, so both rows change in a single round trip. Job timestamps are only filled
+        in if not already set; the evaluation's end time and error message are overwritten
+        when given.
+        
+        Returns:
+            The updated evaluation, or None if no evaluation references the job (the job row
+            is still updated if it exists)
+        """
+        job_fields = {JobRecord.status: status}
+        evaluation_fields = {EvaluationRecord.status: status}
+        if start_time:
+            job_fields[JobRecord.start_time] = fn.COALESCE(JobRecord.start_time, start_time)
+        if end_time:
+            job_fields[JobRecord.end_time] = fn.COALESCE(JobRecord.end_time, end_time)
+            evaluation_fields[EvaluationRecord.end_time] = end_time
+        if error_message:
+            job_fields[JobRecord.error_message] = error_message
+            evaluation_fields[EvaluationRecord.error_message] = error_message
+        
+        finished_job = (JobRecord.update(job_fields)
+                        .where(JobRecord.id == str(job_uuid))
+                        .returning(JobRecord.id)
+                        .cte('finished_job'))
+        query = (EvaluationRecord.update(evaluation_fields)
+                 .from_(finished_job)
+                 .where(EvaluationRecord.job_id == finished_job.c.id)
+                 .with_cte(finished_job)
+                 .returning(EvaluationRecord))
+        return next(iter(query.execute()), None)
+    
     def delete(self, evaluation_uuid: uuid.UUID) -> bool:
         """Delete an evaluation record."""
         try:
@@ -1,9 +1,10 @@
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from peewee import DoesNotExist
+from peewee import DoesNotExist, Tuple
 
-from stroke_seg.dao.models import InferenceRecord
+from stroke_seg.dao.database import BULK_INSERT_BATCH_SIZE, database, execute_prepared
+from stroke_seg.dao.models import InferenceRecord, TableVersionRecord
 
 
 class InferenceDAO:
@@ -17,13 +18,17 @@ class InferenceDAO:
         """Create a new inference record."""
         return inference_record.save(force_insert=True)
     
+    def bulk_create(self, inference_records: List[InferenceRecord]) -> List[InferenceRecord]:
+        """Create many inference records with batched multi-row INSERTs in one transaction."""
+        with database.atomic():
+            InferenceRecord.bulk_create(inference_records, batch_size=BULK_INSERT_BATCH_SIZE)
+        return inference_records
     
     def get_by_predict_id(self, predict_uuid: uuid.UUID) -> Optional[InferenceRecord]:
         """Get an inference by predict_id UUID."""
-        try:
-            return InferenceRecord.get(InferenceRecord.predict_id == str(predict_uuid))
-        except DoesNotExist:
-            return None
+        query = InferenceRecord.select().where(InferenceRecord.predict_id == str(predict_uuid))
+        rows = execute_prepared(query, 'inference_by_predict_id', str(predict_uuid))
+        return rows[0] if rows else None
     
     def list_all(self, limit: Optional[int] = None, offset: int = 0) -> List[InferenceRecord]:
         """Get all inferences with optional pagination."""
@@ -32,6 +37,47 @@ class InferenceDAO:
             query = query.limit(limit)
         return list(query)
     
+    def list_summaries(self, limit: Optional[int] = None, offset: int = 0,
+                       cursor_uuid: Optional[uuid.UUID] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get inference summaries newest first, for list views.
+        
+        Selects only predict_id, model_id, status and created_at, returned as dicts
+        without instantiating models. Pages after the cursor inference when given,
+        otherwise by offset.
+        
+        Returns:
+            The page of summaries, or None if the cursor inference doesn't exist (e.g. it was
+            deleted), since no row would compare after it and paging would silently stop
+        """
+        query = (InferenceRecord
+                 .select(InferenceRecord.predict_id, InferenceRecord.model_id,
+                         InferenceRecord.status, InferenceRecord.created_at)
+                 .order_by(InferenceRecord.created_at.desc(), InferenceRecord.predict_id.desc()))
+        if cursor_uuid:
+            query = query.where(self._after_cursor(cursor_uuid))
+        else:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        summaries = list(query.dicts().iterator())
+        # A missing cursor row makes the keyset condition NULL, which only shows as an empty page
+        if cursor_uuid and not summaries and not self._exists(cursor_uuid):
+            return None
+        return summaries
+    
+    @staticmethod
+    def _exists(predict_uuid: uuid.UUID) -> bool:
+        """Check whether an inference exists."""
+        return InferenceRecord.select().where(InferenceRecord.predict_id == str(predict_uuid)).exists()
+    
+    @staticmethod
+    def _after_cursor(cursor_uuid: uuid.UUID):
+        """Condition matching inferences ordered after the cursor inference (created_at, predict_id descending)."""
+        cursor_row = (InferenceRecord.select(InferenceRecord.created_at, InferenceRecord.predict_id)
+                      .where(InferenceRecord.predict_id == str(cursor_uuid)))
+        return Tuple(InferenceRecord.created_at, InferenceRecord.predict_id) < cursor_row
+    
     def get_by_model_id(self, model_uuid: uuid.UUID) -> List[InferenceRecord]:
         """Get all inferences for a specific model."""
         return list(InferenceRecord.select().where(InferenceRecord.model_id == str(model_uuid)))
@@ -40,7 +86,7 @@ class InferenceDAO:
         """Get all inferences with a specific status."""
         return list(InferenceRecord.select().where(InferenceRecord.status == status))
     
-    def update(self, predict_uuid: uuid.UUID, **kwargs) -> Optional[InferenceRecord]:
+    def update(self, predict_uuid: Union[uuid.UUID, str], **kwargs) -> Optional[InferenceRecord]:
         """Update an inference record."""
         try:
             inference = InferenceRecord.get(InferenceRecord.predict_id == str(predict_uuid))
@@ -60,6 +106,13 @@ class InferenceDAO:
         except DoesNotExist:
             return False
     
+    def get_version(self) -> int:
+        """Get the inference change counter (bumped by trg_inference_version on every write), used as a change marker."""
+        version = (TableVersionRecord.select(TableVersionRecord.version)
+                   .where(TableVersionRecord.table_name == InferenceRecord._meta.table_name)
+                   .scalar())
+        return version or 0
+    
     def count(self) -> int:
         """Get total count of inferences."""
         return InferenceRecord.select().count()
@@ -68,7 +121,7 @@ class InferenceDAO:
         """Get count of inferences for a specific model."""
         return InferenceRecord.select().where(InferenceRecord.model_id == str(model_uuid)).count()
 
-    def get_by_job_id(self, job_uuid: uuid.UUID) -> Optional[InferenceRecord]:
+    def get_by_job_id(self, job_uuid: Union[uuid.UUID, str]) -> Optional[InferenceRecord]:
         """Get an inference by job_id UUID."""
         try:
             return InferenceRecord.get(InferenceRecord.job_id == str(job_uuid))
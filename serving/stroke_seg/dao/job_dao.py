@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from peewee import DoesNotExist
 from stroke_seg.dao.models import JobRecord
 from datetime import datetime
 import uuid
 
+# Non-terminal job statuses, i.e. the jobs the poller still tracks in SLURM
+ACTIVE_JOB_STATUSES = ('PENDING', 'RUNNING')
+
 class JobDAO:
     """Data Access Object for JobRecord operations."""
     
@@ -42,7 +45,13 @@ class JobDAO:
     
     def get_active_jobs(self) -> List[JobRecord]:
         """Get all jobs with PENDING or RUNNING status."""
-        return list(JobRecord.select().where(JobRecord.status.in_(['PENDING', 'RUNNING'])))
+        return list(JobRecord.select().where(JobRecord.status.in_(ACTIVE_JOB_STATUSES)))
+    
+    def get_active_jobs_by_type(self, job_type: str) -> List[JobRecord]:
+        """Get all PENDING or RUNNING jobs of a specific type (served by ix_jobs_status_job_type)."""
+        return list(JobRecord.select().where(
+            JobRecord.status.in_(ACTIVE_JOB_STATUSES) & (JobRecord.job_type == job_type)
+        ))
     
     def list_all(self, limit: Optional[int] = None, offset: int = 0) -> List[JobRecord]:
         """Get all jobs with optional pagination."""
@@ -51,7 +60,7 @@ class JobDAO:
             query = query.limit(limit)
         return list(query)
     
-    def update(self, job_uuid: uuid.UUID, **kwargs) -> Optional[JobRecord]:
+    def update(self, job_uuid: Union[uuid.UUID, str], **kwargs) -> Optional[JobRecord]:
         """Update a job record."""
         try:
             job = JobRecord.get(JobRecord.id == str(job_uuid))
@@ -1,6 +1,7 @@
-from typing import List, Optional
-from peewee import DoesNotExist
-from stroke_seg.dao.models import ModelRecord
+from typing import Any, Dict, List, Optional
+from peewee import DoesNotExist, Tuple
+from stroke_seg.dao.database import BULK_INSERT_BATCH_SIZE, database, execute_prepared
+from stroke_seg.dao.models import ModelRecord, TrainingRecord
 import uuid
 
 class ModelDAO:
@@ -15,23 +16,28 @@ class ModelDAO:
         model_record.save(force_insert=True)
         return model_record
     
+    def bulk_create(self, model_records: List[ModelRecord]) -> List[ModelRecord]:
+        """Create many model records with batched multi-row INSERTs in one transaction."""
+        with database.atomic():
+            ModelRecord.bulk_create(model_records, batch_size=BULK_INSERT_BATCH_SIZE)
+        return model_records
+    
     def get_by_id(self, model_uuid: uuid.UUID) -> Optional[ModelRecord]:
         """Get a model by its UUID."""
-        try:
-            return ModelRecord.get(ModelRecord.id == str(model_uuid))
-        except DoesNotExist:
-            return None
+        query = ModelRecord.select().where(ModelRecord.id == str(model_uuid))
+        rows = execute_prepared(query, 'model_by_id', str(model_uuid))
+        return rows[0] if rows else None
     
     def get_by_training_id(self, training_uuid: uuid.UUID) -> List[ModelRecord]:
         """Get all models for a specific training."""
         return list(ModelRecord.select().where(ModelRecord.training_id == str(training_uuid)))
     
     def get_by_name(self, model_name: str) -> Optional[ModelRecord]:
-        """Get a model by name."""
-        try:
-            return ModelRecord.get(ModelRecord.model_name == model_name)
-        except DoesNotExist:
-            return None
+        """Get the newest model with a given name (names are not unique; a retrained model shadows older ones)."""
+        return (ModelRecord.select()
+                .where(ModelRecord.model_name == model_name)
+                .order_by(ModelRecord.created_at.desc(nulls='last'))
+                .first())
     
     def list_all(self, limit: Optional[int] = None, offset: int = 0) -> List[ModelRecord]:
         """Get all models with optional pagination."""
@@ -40,6 +46,46 @@ class ModelDAO:
             query = query.limit(limit)
         return list(query)
     
+    def list_summaries(self, limit: Optional[int] = None, offset: int = 0,
+                       cursor_uuid: Optional[uuid.UUID] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get model summaries newest first, for list views.
+        
+        Selects only id, model_name, created_at and the training status, returned
+        as dicts without instantiating models. Pages after the cursor model when
+        given, otherwise by offset.
+        
+        Returns:
+            The page of summaries, or None if the cursor model doesn't exist (e.g. it was
+            deleted), since no row would compare after it and paging would silently stop
+        """
+        query = (ModelRecord
+                 .select(ModelRecord.id, ModelRecord.model_name, ModelRecord.created_at, TrainingRecord.status)
+                 .join(TrainingRecord)
+                 .order_by(ModelRecord.created_at.desc(), ModelRecord.id.desc()))
+        if cursor_uuid:
+            query = query.where(self._after_cursor(cursor_uuid))
+        else:
+            query = query.offset(offset)
+        if limit:
+            query = query.limit(limit)
+        summaries = list(query.dicts().iterator())
+        # A missing cursor row makes the keyset condition NULL, which only shows as an empty page
+        if cursor_uuid and not summaries and not self._exists(cursor_uuid):
+            return None
+        return summaries
+    
+    @staticmethod
+    def _exists(model_uuid: uuid.UUID) -> bool:
+        """Check whether a model exists."""
+        return ModelRecord.select().where(ModelRecord.id == str(model_uuid)).exists()
+    
+    @staticmethod
+    def _after_cursor(cursor_uuid: uuid.UUID):
+        """Condition matching models ordered after the cursor model (created_at, id descending)."""
+        cursor_row = ModelRecord.select(ModelRecord.created_at, ModelRecord.id).where(ModelRecord.id == str(cursor_uuid))
+        return Tuple(ModelRecord.created_at, ModelRecord.id) < cursor_row
+    
     def update(self, model_uuid: uuid.UUID, **kwargs) -> Optional[ModelRecord]:
         """Update a model record."""
         try:
@@ -9,7 +9,7 @@ from stroke_seg.dao.database import BaseModel
 class JobRecord(BaseModel):
     """ORM model for the jobs table."""
     id = CharField(primary_key=True, max_length=36, default=lambda: str(uuid.uuid4()))
-    sbatch_id = CharField(max_length=255, null=False)
+    sbatch_id = CharField(max_length=255, null=False, index=True)
     job_type = CharField(max_length=20, null=False, constraints=[Check("job_type IN ('INFERENCE', 'TRAINING', 'EVALUATION')")])
     status = CharField(max_length=20, null=False, constraints=[Check("status IN ('PENDING', 'RUNNING', 'COMPLETED', 'FAILED')")])
     start_time = DateTimeField(null=True)
@@ -19,18 +19,21 @@ class JobRecord(BaseModel):
     
     class Meta:
         table_name = 'jobs'
+        indexes = (
+            (('status', 'job_type'), False),
+        )
 
 
 class TrainingRecord(BaseModel):
     """ORM model for the training table."""
     id = CharField(primary_key=True, max_length=36, default=lambda: str(uuid.uuid4()))
-    name = CharField(max_length=255, null=False)
+    name = CharField(max_length=255, null=False, index=True)
     images_path = CharField(max_length=500, null=True)
     labels_path = CharField(max_length=500, null=True)
     model_path = CharField(max_length=500, null=True)
     configuration = CharField(max_length=20, null=False, constraints=[Check("configuration IN ('2d', '3d_fullres', '3d_lowres', '3d_cascade_lowres')")])
     job_id = ForeignKeyField(JobRecord, field='id', backref='training', null=False)
-    status = CharField(max_length=20, null=False, constraints=[Check("status IN ('TRAINING', 'TRAINED', 'FAILED')")])
+    status = CharField(max_length=20, null=False, index=True, constraints=[Check("status IN ('TRAINING', 'TRAINED', 'FAILED')")])
     progress = FloatField(default=0.0)
     start_time = DateTimeField(null=True)
     end_time = DateTimeField(null=True)
@@ -43,8 +46,8 @@ class ModelRecord(BaseModel):
     """ORM model for the model table."""
     id = CharField(primary_key=True, max_length=36, default=lambda: str(uuid.uuid4()))
     training_id = ForeignKeyField(TrainingRecord, field='id', backref='models', null=False)
-    model_name = CharField(max_length=255, null=False)
-    created_at = DateTimeField(null=True)
+    model_name = CharField(max_length=255, null=False, index=True)
+    created_at = DateTimeField(null=True, index=True)
     
     class Meta:
         table_name = 'model'
@@ -58,15 +61,21 @@ class InferenceRecord(BaseModel):
     input_data = BinaryJSONField(null=False)
     output_dir = CharField(max_length=500, null=True)
     prediction = BinaryJSONField(null=True)
-    status = CharField(max_length=20, null=False, constraints=[Check("status IN ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED')")])
+    status = CharField(max_length=20, null=False, index=True, constraints=[Check("status IN ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED')")])
     start_time = DateTimeField(null=True)
     end_time = DateTimeField(null=True)
     error_message = TextField(null=True)
     created_at = DateTimeField(default=datetime.now)
-    updated_at = DateTimeField(default=datetime.now)
+    # Set by the column default on insert and by trg_inference_updated_at on update
+    updated_at = DateTimeField(null=True, constraints=[SQL('DEFAULT CURRENT_TIMESTAMP')])
     
     class Meta:
         table_name = 'inference'
+        only_save_dirty = True
+        # List ordering and keyset cursor; the SQL index also INCLUDEs model_id and status
+        indexes = (
+            (('created_at', 'predict_id'), False),
+        )
 
 
 class EvaluationRecord(BaseModel):
@@ -84,4 +93,13 @@ class EvaluationRecord(BaseModel):
     created_at = DateTimeField(default=datetime.now)
     
     class Meta:
-        table_name = 'evaluation'
\ No newline at end of file
+        table_name = 'evaluation'
+
+
+class TableVersionRecord(BaseModel):
+    """ORM model for the table_versions table (per-table change counters, bumped by triggers)."""
+    table_name = CharField(primary_key=True, max_length=63)
+    version = BigIntegerField(default=0)
+    
+    class Meta:
+        table_name = 'table_versions'
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Union
 from peewee import DoesNotExist
 from stroke_seg.dao.models import TrainingRecord
 import uuid
@@ -41,14 +41,14 @@ class TrainingDAO:
         """Get all trainings with a specific status."""
         return list(TrainingRecord.select().where(TrainingRecord.status == status))
 
-    def get_by_job_id(self, job_uuid: uuid.UUID) -> Optional[TrainingRecord]:
+    def get_by_job_id(self, job_uuid: Union[uuid.UUID, str]) -> Optional[TrainingRecord]:
         """Get a training by its job_id."""
         try:
             return TrainingRecord.get(TrainingRecord.job_id == str(job_uuid))
         except DoesNotExist:
             return None
     
-    def update(self, training_uuid: uuid.UUID, **kwargs) -> Optional[TrainingRecord]:
+    def update(self, training_uuid: Union[uuid.UUID, str], **kwargs) -> Optional[TrainingRecord]:
         """Update a training record."""
         try:
             training = TrainingRecord.get(TrainingRecord.id == str(training_uuid))
@@ -7,6 +7,9 @@ from flask import jsonify, request
 from .exceptions import ServiceException, InvalidJSONException
 from .logging_config import get_logger
 
+# Methods whose request body is validated as JSON before reaching the controller
+_WRITE_METHODS = frozenset(('POST', 'PUT'))
+
 
 def handle_errors(func):
     """
@@ -31,13 +34,12 @@ def handle_errors(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
         try:
-            # Auto-detect and validate JSON for POST/PUT requests with content
-            if request.method in ['POST', 'PUT'] and request.get_data():
-                try:
-                    data = request.get_json(force=True)
-                    if data is None:
-                        raise InvalidJSONException()
-                except Exception:
+            # Auto-detect and validate JSON for POST/PUT requests with content.
+            # The parsed body is cached on the request, so controllers calling
+            # request.get_json(force=True) afterwards do not parse it again.
+            if request.method in _WRITE_METHODS and (request.content_length or 0) > 0:
+                data = request.get_json(force=True, silent=True, cache=True)
+                if data is None:
                     raise InvalidJSONException()
             
             return func(*args, **kwargs)
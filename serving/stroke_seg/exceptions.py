@@ -48,6 +48,14 @@ class InvalidPaginationException(ClientException):
         super().__init__(message, 400)
 
 
+class InvalidCursorException(ClientException):
+    """Exception raised when a pagination cursor doesn't match any item."""
+    
+    def __init__(self, cursor: str):
+        message = f"Cursor {cursor} does not match any item; restart from the first page"
+        super().__init__(message, 400)
+
+
 class MissingRequiredFieldException(ClientException):
     """Exception raised when required fields are missing."""
     
@@ -88,6 +96,14 @@ class InvalidModelStateException(ClientException):
         super().__init__(message, 409)
 
 
+class InvalidStatusException(ClientException):
+    """Exception raised when a requested status is not one of the known statuses."""
+    
+    def __init__(self, status: str, valid_statuses: list):
+        message = f"Invalid status '{status}', must be one of: {', '.join(valid_statuses)}"
+        super().__init__(message, 400)
+
+
 # Server Error Exceptions (5xx)
 class DatabaseException(ServerException):
     """Exception raised when database operations fail."""
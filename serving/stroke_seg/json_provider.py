@@ -0,0 +1,24 @@
+"""orjson-backed JSON provider for Flask request/response serialization."""
+
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Drop-in replacement for Flask's default JSON provider using orjson.
+
+    Keeps Flask's sorted-key output and falls back to Flask's default hook
+    for types orjson does not handle natively (e.g. Decimal).
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        return orjson.loads(s)
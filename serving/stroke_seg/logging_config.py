@@ -1,67 +1,218 @@
 """Centralized logging configuration for the ML prediction service."""
 
+import atexit
+import copy
 import os
+import queue
+import secrets
 import sys
+import threading
+import time
 import logging
 import logging.handlers
-from datetime import datetime
 from typing import Optional
-import uuid
+
+import orjson
 from flask import request, has_request_context
 
 
+# Record fields used outside a request (startup, poller thread, etc.)
+_NO_REQUEST_CONTEXT = {
+    'request_id': 'no-request-id',
+    'method': '-',
+    'path': '-',
+    'remote_addr': '-',
+}
+
+
+def _resolve_request():
+    """Return the current Flask request object behind the proxy, or None outside a request."""
+    if not has_request_context():
+        return None
+    return request._get_current_object()
+
+
 class RequestContextFilter(logging.Filter):
     """Filter to add request context information to log records."""
     
     def filter(self, record):
-        if has_request_context():
-            record.request_id = getattr(request, 'request_id', 'no-request-id')
-            record.method = request.method
-            record.path = request.path
-            record.remote_addr = request.remote_addr
-        else:
-            record.request_id = 'no-request-id'
-            record.method = '-'
-            record.path = '-'
-            record.remote_addr = '-'
+        current_request = _resolve_request()
+        if current_request is None:
+            record.__dict__.update(_NO_REQUEST_CONTEXT)
+            return True
+
+        # Write the record's __dict__ directly rather than going through setattr
+        fields = record.__dict__
+        fields['request_id'] = current_request.__dict__.get('request_id', 'no-request-id')
+        fields['method'] = current_request.method
+        fields['path'] = current_request.path
+        fields['remote_addr'] = current_request.remote_addr
         return True
 
 
+# Optional record attributes copied into JSON log entries, as (record attribute, JSON key)
+_EXTRA_FIELDS = (
+    ('duration', 'duration_ms'),
+    ('status_code', 'status_code'),
+    ('model_id', 'model_id'),
+    ('predict_id', 'predict_id'),
+)
+_MISSING = object()
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
+    # (whole second, its formatted ISO prefix), shared by all records logged within that second
+    _second_cache = (None, '')
+    
+    def format_timestamp(self, created: float) -> str:
+        """Format a record's creation time as an ISO-8601 UTC timestamp with microseconds."""
+        seconds = int(created)
+        cached_second, prefix = self._second_cache
+        if cached_second != seconds:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+            self._second_cache = (seconds, prefix)
+        return f"{prefix}.{int((created - seconds) * 1_000_000):06d}Z"
+    
     def format(self, record):
+        fields = record.__dict__
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self.format_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
-            'request_id': getattr(record, 'request_id', 'no-request-id'),
-            'method': getattr(record, 'method', '-'),
-            'path': getattr(record, 'path', '-'),
-            'remote_addr': getattr(record, 'remote_addr', '-')
+            'request_id': fields.get('request_id', 'no-request-id'),
+            'method': fields.get('method', '-'),
+            'path': fields.get('path', '-'),
+            'remote_addr': fields.get('remote_addr', '-')
         }
         
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
             
         # Add extra context if available
-        if hasattr(record, 'duration'):
-            log_entry['duration_ms'] = record.duration
-        if hasattr(record, 'status_code'):
-            log_entry['status_code'] = record.status_code
-        if hasattr(record, 'model_id'):
-            log_entry['model_id'] = record.model_id
-        if hasattr(record, 'predict_id'):
-            log_entry['predict_id'] = record.predict_id
+        for attr, key in _EXTRA_FIELDS:
+            value = fields.get(attr, _MISSING)
+            if value is not _MISSING:
+                log_entry[key] = value
             
-        return str(log_entry).replace("'", '"')
+        return orjson.dumps(log_entry, default=str).decode('utf-8')
+
+
+# Shared formatter instances; setup_logging picks one instead of building a new one per call
+_STANDARD_FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(method)s %(path)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_JSON_FORMATTER = JSONFormatter()
+
+
+class InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler for a listener in the same process.
+
+    Merges the message arguments up front, but keeps exc_info so downstream
+    formatters (e.g. JSONFormatter) still see the exception. Records never
+    leave the process, so nothing needs to be made picklable.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that coalesces records into large writes.
+
+    The stream is flushed right away only for records at or above flush_level.
+    Everything else is flushed by a daemon thread every flush_interval seconds
+    if anything was written since, so quiet periods don't leave lines sitting
+    in the buffer. The rollover size check uses a running byte count rather
+    than tell(), which would flush the buffer each time.
+    """
+
+    def __init__(self, filename, buffer_size: int = 64 * 1024, flush_level: int = logging.WARNING,
+                 flush_interval: float = 0.5, **kwargs):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._size = 0
+        self._unflushed = False
+        super().__init__(filename, **kwargs)
+        self._stop_flushing = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_periodically,
+                                              name='log-file-flush', daemon=True)
+        self._flush_thread.start()
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def _flush_periodically(self):
+        """Flush buffered records every flush_interval seconds until the handler is closed."""
+        while not self._stop_flushing.wait(self.flush_interval):
+            if self._unflushed:
+                self.flush()
+
+    def flush(self):
+        self._unflushed = False
+        super().flush()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            # maxBytes is in bytes; len(msg) would count characters
+            msg_size = len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            if self.stream is None:
+                self.stream = self._open()
+            if 0 < self.maxBytes <= self._size + msg_size and self._size:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += msg_size
+
+            if record.levelno >= self.flush_level:
+                self.flush()
+            else:
+                self._unflushed = True
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop_flushing.set()
+        super().close()
+
+
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener():
+    """Flush queued records and stop the background logging thread, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_logging(app_name: str = 'pic_service', log_level: Optional[str] = None):
     """
     Setup centralized logging configuration.
     
+    Output handlers run on a QueueListener thread; loggers only enqueue records,
+    so formatting and I/O stay off the request threads.
+    
     Args:
         app_name: Name of the application for logging context
         log_level: Log level override (DEBUG, INFO, WARNING, ERROR)
@@ -70,35 +221,34 @@ def setup_logging(app_name: str = 'pic_service', log_level: Optional[str] = None
     if log_level is None:
         log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
     
+    level = getattr(logging, log_level, logging.INFO)
+    
     # Determine log format from environment
     log_format = os.getenv('LOG_FORMAT', 'standard')  # standard or json
     
     # Create root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level, logging.INFO))
+    root_logger.setLevel(level)
     
     # Clear existing handlers
+    _stop_queue_listener()
     root_logger.handlers = []
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level, logging.INFO))
+    console_handler.setLevel(level)
     
     # Create request context filter
     request_filter = RequestContextFilter()
     
     # Setup formatter based on environment
     if log_format.lower() == 'json':
-        formatter = JSONFormatter()
+        formatter = _JSON_FORMATTER
     else:
-        formatter = logging.Formatter(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(method)s %(path)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        formatter = _STANDARD_FORMATTER
     
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(request_filter)
-    root_logger.addHandler(console_handler)
+    output_handlers = [console_handler]
     
     # Setup file logging if enabled
     log_file = os.getenv('LOG_FILE')
@@ -109,15 +259,25 @@ def setup_logging(app_name: str = 'pic_service', log_level: Optional[str] = None
             os.makedirs(log_dir, exist_ok=True)
             
         # Create rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             log_file,
             maxBytes=10*1024*1024,  # 10MB
             backupCount=5
         )
-        file_handler.setLevel(getattr(logging, log_level, logging.INFO))
+        file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        file_handler.addFilter(request_filter)
-        root_logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+    
+    # The request filter runs on the queue handler, i.e. in the calling thread where the request context exists
+    queue_handler = InProcessQueueHandler(queue.SimpleQueue())
+    queue_handler.addFilter(request_filter)
+    root_logger.addHandler(queue_handler)
+    
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        queue_handler.queue, *output_handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Configure specific loggers
     # Reduce noise from external libraries
@@ -148,7 +308,7 @@ def get_logger(name: str) -> logging.Logger:
 def add_request_id_to_request():
     """Middleware function to add request ID to Flask request context."""
     if has_request_context():
-        request.request_id = str(uuid.uuid4())
+        request.request_id = secrets.token_hex(8)
 
 
 def log_request_info(logger: logging.Logger, start_time: float, status_code: int):
@@ -157,13 +317,15 @@ def log_request_info(logger: logging.Logger, start_time: float, status_code: int
     
     Args:
         logger: Logger instance
-        start_time: Request start timestamp
+        start_time: Request start time from time.monotonic()
         status_code: HTTP status code
     """
-    if has_request_context():
-        duration = (datetime.now().timestamp() - start_time) * 1000  # Convert to ms
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if _resolve_request() is not None:
+        duration = (time.monotonic() - start_time) * 1000  # Convert to ms
         logger.info(
-            f"Request completed - Status: {status_code}",
+            "Request completed - Status: %s", status_code,
             extra={
                 'duration': round(duration, 2),
                 'status_code': status_code
@@ -183,10 +345,16 @@ def log_db_operation(logger: logging.Logger, operation: str, table: str,
         duration: Operation duration in milliseconds
         record_count: Number of records affected
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    if duration is None and record_count is None:
+        # Operation and table are already in the message; no extra fields to attach
+        logger.info("DB %s on %s", operation, table)
+        return
     extra = {'operation': operation, 'table': table}
     if duration is not None:
         extra['duration'] = round(duration, 2)
     if record_count is not None:
         extra['record_count'] = record_count
         
-    logger.info(f"DB {operation} on {table}", extra=extra)
\ No newline at end of file
+    logger.info("DB %s on %s", operation, table, extra=extra)
\ No newline at end of file
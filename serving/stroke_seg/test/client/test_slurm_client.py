@@ -0,0 +1,178 @@
+"""Tests for SlurmClient batched job queries and the shared job info cache."""
+
+from datetime import datetime
+
+import pytest
+
+# Load the controllers first, as the app does; importing stroke_seg.bl directly hits a circular import
+import stroke_seg.controller  # noqa: F401
+from stroke_seg.bl.client.slurm.slurm_client import SlurmClient
+from stroke_seg.exceptions import ModelCreationException
+
+
+INVALID_JOB_ID_STDERR = 'slurm_load_jobs error: Invalid job id specified\n'
+
+SCONTROL_FAILED_JOB = (
+    'JobId=103 JobName=train_model\n'
+    '   JobState=FAILED Reason=NonZeroExitCode Dependency=(null)\n'
+    '   ExitCode=1:0\n'
+    '   StartTime=2025-09-13T12:14:02 EndTime=2025-09-13T12:20:00\n'
+)
+
+
+def squeue_line(job_id, state, start='N/A', end='N/A', reason='None'):
+    """Format one job the way squeue prints it with SQUEUE_JOB_FORMAT."""
+    return f'JobId={job_id} JobState={state} StartTime={start} EndTime={end} Reason={reason}'
+
+
+class StubBashClient:
+    """BashClient stand-in returning canned (stdout, stderr, return_code) per command name."""
+
+    def __init__(self, squeue=('', '', 0), scontrol=('', '', 1)):
+        self.responses = {'squeue': squeue, 'scontrol': scontrol}
+        self.commands = []
+
+    def execute_command(self, command):
+        self.commands.append(command)
+        return self.responses[command[0]]
+
+    def squeue_job_lists(self):
+        """The --jobs argument of every squeue call made so far."""
+        return [command[command.index('--jobs') + 1] for command in self.commands if command[0] == 'squeue']
+
+
+class TestQueryJobsInfo:
+    """Test cases for parsing a single batched squeue call."""
+
+    def test_parses_each_job_including_reason_with_spaces_and_commas(self):
+        """Test that multi-word reasons stay intact and each job gets its own summary."""
+        bash_client = StubBashClient(squeue=('\n'.join([
+            squeue_line('101', 'PENDING', reason='ReqNodeNotAvail, UnavailableNodes:n1'),
+            squeue_line('102', 'RUNNING', start='2025-09-13T12:14:02'),
+        ]) + '\n', '', 0))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        jobs_info = client.get_jobs_info(['101', '102'])
+
+        assert jobs_info['101']['internal_status'] == 'PENDING'
+        assert jobs_info['101']['reason'] == 'ReqNodeNotAvail, UnavailableNodes:n1'
+        assert jobs_info['102']['internal_status'] == 'RUNNING'
+        assert jobs_info['102']['start_time'] == datetime(2025, 9, 13, 12, 14, 2)
+        assert bash_client.squeue_job_lists() == ['101,102']
+
+    def test_jobs_missing_from_output_are_treated_as_completed(self):
+        """Test that a job squeue no longer reports gets the completed summary."""
+        bash_client = StubBashClient(squeue=(squeue_line('101', 'RUNNING') + '\n', '', 0))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        jobs_info = client.get_jobs_info(['101', '102'])
+
+        assert jobs_info['101']['state'] == 'RUNNING'
+        assert jobs_info['102']['state'] == 'NOT_FOUND'
+        assert jobs_info['102']['internal_status'] == 'COMPLETED'
+        assert jobs_info['102']['is_finished'] is True
+
+    def test_all_jobs_missing_with_nonzero_exit(self):
+        """Test that squeue's invalid job id failure marks every requested job as completed."""
+        bash_client = StubBashClient(squeue=('', INVALID_JOB_ID_STDERR, 1))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        jobs_info = client.get_jobs_info(['101', '102'])
+
+        assert {job_id: info['state'] for job_id, info in jobs_info.items()} == {
+            '101': 'NOT_FOUND',
+            '102': 'NOT_FOUND',
+        }
+
+    def test_other_squeue_failure_raises(self):
+        """Test that squeue failures other than unknown job ids are raised."""
+        bash_client = StubBashClient(squeue=('', 'squeue: error: Unable to contact slurm controller\n', 1))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        with pytest.raises(ModelCreationException):
+            client.get_jobs_info(['101'])
+
+    def test_failed_job_is_reread_with_scontrol(self):
+        """Test that a failed job's summary comes from scontrol, which reports the exit code."""
+        bash_client = StubBashClient(
+            squeue=(squeue_line('103', 'FAILED', reason='NonZeroExitCode') + '\n', '', 0),
+            scontrol=(SCONTROL_FAILED_JOB, '', 0),
+        )
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        job_info = client.get_jobs_info(['103'])['103']
+
+        assert job_info['internal_status'] == 'FAILED'
+        assert job_info['exit_code'] == '1:0'
+        assert 'Exit code: 1:0' in job_info['error_message']
+        assert ['scontrol', 'show', 'job', '103'] in bash_client.commands
+
+    def test_failed_job_keeps_squeue_summary_when_scontrol_lost_it(self):
+        """Test that the squeue summary is kept if scontrol no longer knows the failed job."""
+        bash_client = StubBashClient(
+            squeue=(squeue_line('103', 'FAILED', reason='NonZeroExitCode') + '\n', '', 0),
+            scontrol=('', 'slurm_load_jobs error: Invalid job id specified\n', 1),
+        )
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        job_info = client.get_jobs_info(['103'])['103']
+
+        assert job_info['state'] == 'FAILED'
+        assert job_info['internal_status'] == 'FAILED'
+        assert job_info['reason'] == 'NonZeroExitCode'
+
+
+class TestJobsInfoCache:
+    """Test cases for the short-lived get_jobs_info cache."""
+
+    def test_cached_jobs_are_not_queried_again(self):
+        """Test that a repeated request within the TTL doesn't run squeue."""
+        bash_client = StubBashClient(squeue=(squeue_line('101', 'RUNNING') + '\n', '', 0))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+
+        client.get_jobs_info(['101'])
+        jobs_info = client.get_jobs_info(['101'])
+
+        assert jobs_info['101']['state'] == 'RUNNING'
+        assert bash_client.squeue_job_lists() == ['101']
+
+    def test_partial_hit_queries_missing_and_tracked_unfinished_jobs(self):
+        """Test that a miss refreshes the missing jobs together with the unfinished jobs already cached."""
+        bash_client = StubBashClient(squeue=(squeue_line('101', 'RUNNING') + '\n', '', 0))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+        client.get_jobs_info(['101'])
+
+        bash_client.responses['squeue'] = ('\n'.join([
+            squeue_line('102', 'PENDING', reason='Priority'),
+            squeue_line('101', 'RUNNING'),
+        ]) + '\n', '', 0)
+        jobs_info = client.get_jobs_info(['101', '102'])
+
+        assert bash_client.squeue_job_lists() == ['101', '102,101']
+        assert jobs_info['101']['state'] == 'RUNNING'
+        assert jobs_info['102']['state'] == 'PENDING'
+
+        # Both jobs are now fresh in the rebuilt cache
+        client.get_jobs_info(['101', '102'])
+        assert len(bash_client.squeue_job_lists()) == 2
+
+    def test_finished_jobs_are_not_tracked(self):
+        """Test that jobs reported as finished aren't re-queried alongside later misses."""
+        bash_client = StubBashClient(squeue=('', INVALID_JOB_ID_STDERR, 1))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=60)
+        client.get_jobs_info(['101'])
+
+        bash_client.responses['squeue'] = (squeue_line('102', 'RUNNING') + '\n', '', 0)
+        client.get_jobs_info(['102'])
+
+        assert bash_client.squeue_job_lists() == ['101', '102']
+
+    def test_zero_ttl_disables_caching(self):
+        """Test that every call queries squeue when cache_ttl is 0."""
+        bash_client = StubBashClient(squeue=(squeue_line('101', 'RUNNING') + '\n', '', 0))
+        client = SlurmClient(bash_client=bash_client, cache_ttl=0)
+
+        client.get_jobs_info(['101'])
+        client.get_jobs_info(['101'])
+
+        assert bash_client.squeue_job_lists() == ['101', '101']
@@ -1,6 +1,7 @@
 import pytest
 import os
 import sys
+from datetime import datetime
 from pathlib import Path
 from testcontainers.postgres import PostgresContainer
 
@@ -9,14 +10,25 @@ service_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(service_dir))
 
 from stroke_seg.dao.database import database, close_pool
-from stroke_seg.dao.models import TrainingRecord, InferenceRecord
+from stroke_seg.dao.models import (
+    EvaluationRecord, InferenceRecord, JobRecord, ModelRecord, TableVersionRecord, TrainingRecord
+)
+
+# The init script predates later migrations (e.g. the evaluation table), so the tables are
+# created from the models; the script then only adds its functions and triggers
+SCHEMA_MODELS = [JobRecord, TrainingRecord, ModelRecord, InferenceRecord, EvaluationRecord, TableVersionRecord]
+
+INIT_SCRIPT_PATH = Path(__file__).parents[4] / "db" / "init" / "01_init_schema.sql"
+
+CLEAN_TABLES_SQL = (
+    f'TRUNCATE {JobRecord._meta.table_name}, {TrainingRecord._meta.table_name}, '
+    f'{ModelRecord._meta.table_name}, {InferenceRecord._meta.table_name}, '
+    f'{EvaluationRecord._meta.table_name} RESTART IDENTITY CASCADE'
+)
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_db():
     """Setup test database configuration with testcontainers."""
-    import docker
-    from testcontainers.postgres import PostgresContainer
-
     if 'TESTCONTAINERS_REUSE_ENABLE' not in os.environ:
         os.environ['TESTCONTAINERS_REUSE_ENABLE'] = 'false'
 
@@ -25,6 +37,8 @@ def setup_test_db():
     postgres.with_env("POSTGRES_DB", "pic_db")
     postgres.with_env("POSTGRES_USER", "pic_user")
     postgres.with_env("POSTGRES_PASSWORD", "pic_password")
+    # Throwaway data directory in memory: faster initdb and no disk I/O during tests
+    postgres.with_kwargs(tmpfs={'/var/lib/postgresql/data': 'rw'})
 
     postgres.start()
 
@@ -38,10 +52,6 @@ def setup_test_db():
     os.environ['DB_MAX_CONNECTIONS'] = '3'
     os.environ['DB_STALE_TIMEOUT'] = '60'
 
-    # Reinitialize database connection with new config
-    from playhouse.pool import PooledPostgresqlDatabase
-    from stroke_seg.dao.database import database
-
     # Initialize the pool with test configuration
     database.init(
         postgres.dbname,
@@ -54,9 +64,9 @@ def setup_test_db():
         timeout=10
     )
 
-    # Create tables using SQL initialization script
-    init_script_path = Path(__file__).parent.parent.parent / "db" / "init" / "01_init_schema.sql"
-    with open(init_script_path, 'r') as f:
+    # Create tables from the models, then the functions and triggers from the SQL initialization script
+    database.create_tables(SCHEMA_MODELS)
+    with open(INIT_SCRIPT_PATH, 'r') as f:
         init_sql = f.read()
     database.execute_sql(init_sql)
 
@@ -69,10 +79,23 @@ def setup_test_db():
 @pytest.fixture
 def clean_db():
     """Clean database before each test."""
-    # Delete all records to ensure test isolation
-    InferenceRecord.delete().execute()
-    TrainingRecord.delete().execute()
+    # Truncate instead of deleting row by row; CASCADE also clears rows referencing these tables
+    database.execute_sql(CLEAN_TABLES_SQL)
     yield
     # Clean up after test
-    InferenceRecord.delete().execute()
-    TrainingRecord.delete().execute()
\ No newline at end of file
+    database.execute_sql(CLEAN_TABLES_SQL)
+
+
+@pytest.fixture
+def model_record(clean_db) -> ModelRecord:
+    """A model with its completed training and training job, to attach inferences and evaluations to."""
+    training = TrainingRecord.create(
+        name='test_model',
+        images_path='/data/images',
+        labels_path='/data/labels',
+        model_path='/data/models/test_model',
+        configuration='3d_fullres',
+        job_id=JobRecord.create(sbatch_id='1001', job_type='TRAINING', status='COMPLETED'),
+        status='TRAINED'
+    )
+    return ModelRecord.create(training_id=training, model_name='test_model', created_at=datetime.now())
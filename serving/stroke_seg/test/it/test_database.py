@@ -0,0 +1,103 @@
+"""Integration tests for the prepared statement helper in stroke_seg.dao.database."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from stroke_seg.dao.database import database, execute_prepared
+from stroke_seg.dao.models import ModelRecord
+
+STATEMENT_NAME = 'test_model_by_id'
+
+
+def get_model(model_id: str):
+    """Look a model up through the prepared statement."""
+    query = ModelRecord.select().where(ModelRecord.id == model_id)
+    return execute_prepared(query, STATEMENT_NAME, model_id)
+
+
+def prepare_time(name: str = STATEMENT_NAME):
+    """When the statement was prepared on this thread's connection, or None if it isn't."""
+    return database.execute_sql(
+        'SELECT prepare_time FROM pg_prepared_statements WHERE name = %s', (name,)).fetchone()
+
+
+@pytest.fixture
+def fresh_connection():
+    """Start the test on a newly opened pooled connection, which has no prepared statements."""
+    database.close()
+    database.close_all()
+    yield
+    # Don't hand statements prepared under an altered schema to later tests
+    database.close()
+    database.close_all()
+
+
+class TestExecutePrepared:
+    """Test cases for execute_prepared's lazy PREPARE and re-prepare handling."""
+
+    def test_first_call_prepares_on_fresh_connection(self, model_record, fresh_connection):
+        """Test that the first EXECUTE on a new connection prepares the statement and returns model instances."""
+        assert prepare_time() is None
+
+        rows = get_model(model_record.id)
+
+        assert len(rows) == 1
+        assert isinstance(rows[0], ModelRecord)
+        assert (rows[0].id, rows[0].model_name) == (model_record.id, model_record.model_name)
+        assert prepare_time() is not None
+
+    def test_second_call_reuses_statement(self, model_record, fresh_connection):
+        """Test that later calls, with other parameters, run the already prepared statement."""
+        other_model = ModelRecord.create(training_id=model_record.training_id, model_name='other_model',
+                                         created_at=datetime.now())
+        get_model(model_record.id)
+        prepared_at = prepare_time()
+
+        rows = get_model(other_model.id)
+
+        assert [row.model_name for row in rows] == ['other_model']
+        assert prepare_time() == prepared_at
+
+    def test_no_match_returns_empty_list(self, model_record, fresh_connection):
+        """Test that a parameter matching no row returns an empty list."""
+        assert get_model(str(uuid.uuid4())) == []
+
+    def test_inside_transaction_runs_query_directly(self, model_record, fresh_connection):
+        """Test that inside atomic() the query runs unprepared, so a failed EXECUTE can't abort the transaction."""
+        with database.atomic():
+            rows = get_model(model_record.id)
+            assert prepare_time() is None
+            # The transaction is still usable
+            assert ModelRecord.select().where(ModelRecord.id == model_record.id).exists()
+
+        assert [row.id for row in rows] == [model_record.id]
+
+    def test_reprepares_after_result_type_changes(self, model_record, fresh_connection):
+        """Test that a statement whose cached plan no longer matches the table is deallocated and prepared again."""
+        get_model(model_record.id)
+        prepared_at = prepare_time()
+        table = ModelRecord._meta.table_name
+        database.execute_sql(f'ALTER TABLE {table} ALTER COLUMN model_name TYPE TEXT')
+        try:
+            rows = get_model(model_record.id)
+        finally:
+            database.execute_sql(f'ALTER TABLE {table} ALTER COLUMN model_name TYPE VARCHAR(255)')
+
+        assert [row.model_name for row in rows] == [model_record.model_name]
+        assert prepare_time() > prepared_at
+
+    def test_added_column_does_not_change_statement(self, model_record, fresh_connection):
+        """Test that the explicit column list keeps the statement valid when a column is added."""
+        get_model(model_record.id)
+        prepared_at = prepare_time()
+        table = ModelRecord._meta.table_name
+        database.execute_sql(f'ALTER TABLE {table} ADD COLUMN notes TEXT')
+        try:
+            rows = get_model(model_record.id)
+        finally:
+            database.execute_sql(f'ALTER TABLE {table} DROP COLUMN notes')
+
+        assert [row.id for row in rows] == [model_record.id]
+        assert prepare_time() == prepared_at
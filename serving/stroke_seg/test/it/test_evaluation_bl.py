@@ -0,0 +1,97 @@
+"""Integration tests for EvaluationBL status updates."""
+
+import uuid
+
+import pytest
+
+# Load the controllers first, as the app does; importing stroke_seg.bl directly hits a circular import
+import stroke_seg.controller  # noqa: F401
+from stroke_seg.bl.evaluation.evaluation_bl import EvaluationBL
+from stroke_seg.dao.models import EvaluationRecord, JobRecord
+from stroke_seg.exceptions import (
+    InvalidModelStateException,
+    InvalidStatusException,
+    InvalidUUIDException,
+    ModelNotFoundException
+)
+
+
+def create_evaluation(model_record, status: str = 'PENDING') -> EvaluationRecord:
+    """Insert an evaluation of the model, with its evaluation job."""
+    job = JobRecord.create(sbatch_id='2001', job_type='EVALUATION', status='PENDING')
+    return EvaluationRecord.create(model_id=model_record, job_id=job, evaluation_path='/data/evaluation',
+                                   configurations=['3d_fullres'], status=status)
+
+
+@pytest.fixture(scope='module')
+def evaluation_bl():
+    """EvaluationBL shared by the module's tests; it keeps no per-test state."""
+    return EvaluationBL()
+
+
+class TestUpdateEvaluationStatus:
+    """Test cases for EvaluationBL.update_evaluation_status transitions and errors."""
+
+    def test_allowed_transition(self, evaluation_bl, model_record):
+        """Test that PENDING -> EVALUATING is applied."""
+        evaluation = create_evaluation(model_record)
+
+        result = evaluation_bl.update_evaluation_status(evaluation.id, 'EVALUATING')
+
+        assert result['status'] == 'EVALUATING'
+        assert EvaluationRecord.get_by_id(evaluation.id).status == 'EVALUATING'
+
+    def test_completion_sets_end_time_and_results(self, evaluation_bl, model_record):
+        """Test that moving to a terminal status stores the results and an end time."""
+        evaluation = create_evaluation(model_record, status='EVALUATING')
+
+        evaluation_bl.update_evaluation_status(evaluation.id, 'COMPLETED', results={'dice': 0.81})
+
+        stored = EvaluationRecord.get_by_id(evaluation.id)
+        assert stored.status == 'COMPLETED'
+        assert stored.results == {'dice': 0.81}
+        assert stored.end_time is not None
+
+    @pytest.mark.parametrize('status', ['EVALUATING', 'COMPLETED', 'FAILED'])
+    def test_repeated_status_is_accepted(self, evaluation_bl, model_record, status):
+        """Test that re-sending the current status succeeds, including for terminal statuses."""
+        evaluation = create_evaluation(model_record, status=status)
+
+        result = evaluation_bl.update_evaluation_status(evaluation.id, status)
+
+        assert result['status'] == status
+
+    @pytest.mark.parametrize('terminal_status', ['COMPLETED', 'FAILED'])
+    def test_terminal_to_evaluating_is_409(self, evaluation_bl, model_record, terminal_status):
+        """Test that a finished evaluation can't be moved back, and is left unchanged."""
+        evaluation = create_evaluation(model_record, status=terminal_status)
+
+        with pytest.raises(InvalidModelStateException) as exc_info:
+            evaluation_bl.update_evaluation_status(evaluation.id, 'EVALUATING')
+
+        assert exc_info.value.status_code == 409
+        assert EvaluationRecord.get_by_id(evaluation.id).status == terminal_status
+
+    def test_missing_evaluation_is_404(self, evaluation_bl, model_record):
+        """Test that a well-formed ID matching no evaluation is reported as not found."""
+        with pytest.raises(ModelNotFoundException) as exc_info:
+            evaluation_bl.update_evaluation_status(str(uuid.uuid4()), 'EVALUATING')
+
+        assert exc_info.value.status_code == 404
+
+    def test_unknown_status_is_400(self, evaluation_bl, model_record):
+        """Test that a status outside the known set is rejected before touching the evaluation."""
+        evaluation = create_evaluation(model_record)
+
+        with pytest.raises(InvalidStatusException) as exc_info:
+            evaluation_bl.update_evaluation_status(evaluation.id, 'DONE')
+
+        assert exc_info.value.status_code == 400
+        assert EvaluationRecord.get_by_id(evaluation.id).status == 'PENDING'
+
+    def test_malformed_id_is_400(self, evaluation_bl, model_record):
+        """Test that an ID that isn't a UUID is rejected."""
+        with pytest.raises(InvalidUUIDException) as exc_info:
+            evaluation_bl.update_evaluation_status('not-a-uuid', 'EVALUATING')
+
+        assert exc_info.value.status_code == 400
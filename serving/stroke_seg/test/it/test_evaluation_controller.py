@@ -0,0 +1,105 @@
+"""Integration tests for the evaluation list endpoint."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from stroke_seg.controller.evaluation_controller import evaluation_bp
+from stroke_seg.controller.pagination import NEXT_CURSOR_HEADER
+from stroke_seg.dao.models import EvaluationRecord, JobRecord
+from stroke_seg.json_provider import ORJSONProvider
+
+
+@pytest.fixture
+def client():
+    """Test client for an app serving only the evaluation endpoints."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.register_blueprint(evaluation_bp)
+    return app.test_client()
+
+
+def create_evaluation(model_record, **fields) -> EvaluationRecord:
+    """Insert a pending evaluation of the model, with its evaluation job."""
+    job = JobRecord.create(sbatch_id='2001', job_type='EVALUATION', status='PENDING')
+    return EvaluationRecord.create(model_id=model_record, job_id=job, evaluation_path='/data/evaluation',
+                                   configurations=['3d_fullres'], status='PENDING', **fields)
+
+
+def list_all_pages(client, limit):
+    """Follow X-Next-Cursor from the first page until a page comes back without it."""
+    pages = []
+    url = f'/api/v1/evaluation/list?limit={limit}'
+    while True:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+        assert cursor == pages[-1][-1]['evaluationId']
+        url = f'/api/v1/evaluation/list?limit={limit}&cursor={cursor}'
+
+
+class TestListEvaluationsPaging:
+    """Test cases for keyset (cursor) paging of /evaluation/list."""
+
+    def test_pages_through_ties_on_created_at(self, client, model_record):
+        """Test that evaluations sharing created_at are each listed once, ordered by ID."""
+        created_at = datetime(2026, 1, 1, 12, 0, 0)
+        evaluation_ids = [create_evaluation(model_record, created_at=created_at).id for _ in range(5)]
+
+        pages = list_all_pages(client, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [item['evaluationId'] for page in pages for item in page] == sorted(evaluation_ids, reverse=True)
+
+    def test_pages_newest_first(self, client, model_record):
+        """Test that pages follow created_at descending across page boundaries."""
+        evaluations = [create_evaluation(model_record, created_at=datetime(2026, 1, day)) for day in range(1, 5)]
+
+        pages = list_all_pages(client, limit=3)
+
+        listed = [item['evaluationId'] for page in pages for item in page]
+        assert listed == [evaluation.id for evaluation in reversed(evaluations)]
+
+    def test_full_last_page_is_followed_by_empty_page(self, client, model_record):
+        """Test that a full last page still carries a cursor, which leads to an empty page without one."""
+        for _ in range(4):
+            create_evaluation(model_record)
+
+        pages = list_all_pages(client, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 0]
+
+    def test_partial_page_has_no_cursor(self, client, model_record):
+        """Test that X-Next-Cursor is only set on a full page."""
+        create_evaluation(model_record)
+
+        response = client.get('/api/v1/evaluation/list?limit=2')
+
+        assert len(response.get_json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_deleted_cursor_returns_400(self, client, model_record):
+        """Test that a cursor whose evaluation was deleted between pages is rejected instead of ending the list."""
+        for _ in range(3):
+            create_evaluation(model_record)
+        first_page = client.get('/api/v1/evaluation/list?limit=2')
+        cursor = first_page.headers[NEXT_CURSOR_HEADER]
+        EvaluationRecord.delete().where(EvaluationRecord.id == cursor).execute()
+
+        response = client.get(f'/api/v1/evaluation/list?limit=2&cursor={cursor}')
+
+        assert response.status_code == 400
+        assert cursor in response.get_json()['message']
+
+    def test_unknown_cursor_returns_400(self, client, model_record):
+        """Test that a well-formed cursor matching no evaluation is rejected."""
+        create_evaluation(model_record)
+
+        response = client.get(f'/api/v1/evaluation/list?limit=2&cursor={uuid.uuid4()}')
+
+        assert response.status_code == 400
@@ -0,0 +1,138 @@
+"""Integration tests for EvaluationDAO."""
+
+from datetime import datetime
+
+from stroke_seg.dao.evaluation_dao import EvaluationDAO
+from stroke_seg.dao.models import EvaluationRecord, JobRecord
+
+
+def create_job(**fields) -> JobRecord:
+    """Insert a running evaluation job."""
+    return JobRecord.create(sbatch_id='2001', job_type='EVALUATION', status='RUNNING', **fields)
+
+
+def create_evaluation(model_record, status: str = 'PENDING', job: JobRecord = None, **fields) -> EvaluationRecord:
+    """Insert an evaluation of the model, with its evaluation job."""
+    job = job or create_job()
+    return EvaluationRecord.create(model_id=model_record, job_id=job, evaluation_path='/data/evaluation',
+                                   configurations=['3d_fullres'], status=status, **fields)
+
+
+class TestUpdateStatus:
+    """Test cases for the guarded UPDATE ... RETURNING status update."""
+
+    def test_updates_when_current_status_allowed(self, model_record):
+        """Test that the row is updated and returned when its status is in allowed_statuses."""
+        evaluation = create_evaluation(model_record)
+
+        updated = EvaluationDAO().update_status(evaluation.id, ('PENDING',), status='EVALUATING')
+
+        assert updated.id == evaluation.id
+        assert updated.status == 'EVALUATING'
+        assert EvaluationRecord.get_by_id(evaluation.id).status == 'EVALUATING'
+
+    def test_returns_none_and_leaves_row_when_status_not_allowed(self, model_record):
+        """Test that a disallowed current status makes the update a no-op."""
+        evaluation = create_evaluation(model_record, status='COMPLETED')
+
+        updated = EvaluationDAO().update_status(evaluation.id, ('PENDING',), status='EVALUATING')
+
+        assert updated is None
+        assert EvaluationRecord.get_by_id(evaluation.id).status == 'COMPLETED'
+
+    def test_returns_none_for_missing_evaluation(self, model_record):
+        """Test that an unknown ID updates nothing."""
+        assert EvaluationDAO().update_status('00000000-0000-0000-0000-000000000000', ('PENDING',),
+                                             status='EVALUATING') is None
+
+    def test_writes_extra_fields(self, model_record):
+        """Test that the other given fields are written in the same statement."""
+        evaluation = create_evaluation(model_record, status='EVALUATING')
+
+        updated = EvaluationDAO().update_status(evaluation.id, ('EVALUATING',), status='FAILED',
+                                                error_message='Out of memory')
+
+        assert updated.error_message == 'Out of memory'
+        assert EvaluationRecord.get_by_id(evaluation.id).error_message == 'Out of memory'
+
+
+class TestFinalizeWithJob:
+    """Test cases for moving a job and its evaluation to a terminal status in one statement."""
+
+    START_TIME = datetime(2026, 1, 1, 10, 0, 0)
+    END_TIME = datetime(2026, 1, 1, 11, 30, 0)
+
+    def test_completes_job_and_evaluation(self, model_record):
+        """Test that both rows reach COMPLETED and the job's missing timestamps are filled in."""
+        evaluation = create_evaluation(model_record, status='EVALUATING')
+
+        finalized = EvaluationDAO().finalize_with_job(evaluation.job_id.id, 'COMPLETED',
+                                                      start_time=self.START_TIME, end_time=self.END_TIME)
+
+        job = JobRecord.get_by_id(evaluation.job_id.id)
+        assert finalized.id == evaluation.id
+        assert finalized.status == 'COMPLETED'
+        assert finalized.end_time == self.END_TIME
+        assert EvaluationRecord.get_by_id(evaluation.id).status == 'COMPLETED'
+        assert (job.status, job.start_time, job.end_time) == ('COMPLETED', self.START_TIME, self.END_TIME)
+
+    def test_fails_job_and_evaluation_with_error_message(self, model_record):
+        """Test that both rows reach FAILED and both get the error message."""
+        evaluation = create_evaluation(model_record, status='EVALUATING')
+
+        finalized = EvaluationDAO().finalize_with_job(evaluation.job_id.id, 'FAILED', end_time=self.END_TIME,
+                                                      error_message='Job failed with non-zero exit code')
+
+        job = JobRecord.get_by_id(evaluation.job_id.id)
+        assert finalized.status == 'FAILED'
+        assert finalized.error_message == 'Job failed with non-zero exit code'
+        assert (job.status, job.error_message) == ('FAILED', 'Job failed with non-zero exit code')
+
+    def test_keeps_existing_job_timestamps(self, model_record):
+        """Test that the job's start and end times are only set when empty; the evaluation's end time is overwritten."""
+        job_start, job_end = datetime(2026, 1, 1, 9, 0, 0), datetime(2026, 1, 1, 9, 45, 0)
+        evaluation = create_evaluation(model_record, status='EVALUATING',
+                                       job=create_job(start_time=job_start, end_time=job_end),
+                                       end_time=datetime(2025, 12, 31))
+
+        finalized = EvaluationDAO().finalize_with_job(evaluation.job_id.id, 'COMPLETED',
+                                                      start_time=self.START_TIME, end_time=self.END_TIME)
+
+        job = JobRecord.get_by_id(evaluation.job_id.id)
+        assert (job.start_time, job.end_time) == (job_start, job_end)
+        assert finalized.end_time == self.END_TIME
+
+    def test_leaves_fields_not_given(self, model_record):
+        """Test that omitted timestamps and error message are left as they are."""
+        evaluation = create_evaluation(model_record, status='EVALUATING', error_message='earlier warning')
+
+        finalized = EvaluationDAO().finalize_with_job(evaluation.job_id.id, 'COMPLETED')
+
+        job = JobRecord.get_by_id(evaluation.job_id.id)
+        assert (job.start_time, job.end_time, job.error_message) == (None, None, None)
+        assert finalized.end_time is None
+        assert finalized.error_message == 'earlier warning'
+
+    def test_returns_none_without_evaluation(self, model_record):
+        """Test that a job no evaluation references returns None, but the job is still finalized."""
+        job = create_job()
+
+        assert EvaluationDAO().finalize_with_job(job.id, 'COMPLETED', end_time=self.END_TIME) is None
+        assert JobRecord.get_by_id(job.id).status == 'COMPLETED'
+
+    def test_returns_none_for_missing_job(self, model_record):
+        """Test that an unknown job ID updates nothing."""
+        evaluation = create_evaluation(model_record, status='EVALUATING')
+
+        assert EvaluationDAO().finalize_with_job('00000000-0000-0000-0000-000000000000', 'COMPLETED') is None
+        assert EvaluationRecord.get_by_id(evaluation.id).status == 'EVALUATING'
+
+    def test_only_updates_the_jobs_evaluation(self, model_record):
+        """Test that other evaluations are untouched."""
+        evaluation = create_evaluation(model_record, status='EVALUATING')
+        other = create_evaluation(model_record, status='EVALUATING')
+
+        EvaluationDAO().finalize_with_job(evaluation.job_id.id, 'COMPLETED')
+
+        assert EvaluationRecord.get_by_id(other.id).status == 'EVALUATING'
+        assert JobRecord.get_by_id(other.job_id.id).status == 'RUNNING'
@@ -0,0 +1,52 @@
+"""Integration tests for InferenceDAO."""
+
+from stroke_seg.dao.database import database
+from stroke_seg.dao.inference_dao import InferenceDAO
+from stroke_seg.dao.models import InferenceRecord
+
+
+def create_inference(model_record, **fields) -> InferenceRecord:
+    """Insert a pending inference for the model."""
+    return InferenceRecord.create(model_id=model_record, input_data={'images_path': '/data/input'},
+                                  status='PENDING', **fields)
+
+
+class TestInferenceVersion:
+    """Test cases for the inference change counter behind the prediction list ETag."""
+
+    def test_version_bumped_by_insert_update_and_delete(self, model_record):
+        """Test that every write statement on inference raises the version."""
+        inference_dao = InferenceDAO()
+        versions = [inference_dao.get_version()]
+
+        inference = create_inference(model_record)
+        versions.append(inference_dao.get_version())
+
+        inference_dao.update(inference.predict_id, status='PROCESSING')
+        versions.append(inference_dao.get_version())
+
+        inference_dao.delete(inference.predict_id)
+        versions.append(inference_dao.get_version())
+
+        assert versions == sorted(set(versions))
+
+    def test_version_bumped_by_truncate(self, model_record):
+        """Test that TRUNCATE, which fires no row triggers, still raises the version."""
+        inference_dao = InferenceDAO()
+        create_inference(model_record)
+        version_before = inference_dao.get_version()
+
+        database.execute_sql(f'TRUNCATE {InferenceRecord._meta.table_name}')
+
+        assert inference_dao.get_version() > version_before
+
+    def test_version_unchanged_by_reads(self, model_record):
+        """Test that reading inferences leaves the version alone."""
+        inference_dao = InferenceDAO()
+        create_inference(model_record)
+        version_before = inference_dao.get_version()
+
+        inference_dao.get_by_model_id(model_record.id)
+        inference_dao.list_summaries(limit=10)
+
+        assert inference_dao.get_version() == version_before
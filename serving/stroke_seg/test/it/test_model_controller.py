@@ -0,0 +1,90 @@
+"""Integration tests for the model list endpoint."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from stroke_seg.controller.model_controller import model_bp
+from stroke_seg.controller.pagination import NEXT_CURSOR_HEADER
+from stroke_seg.dao.models import ModelRecord
+from stroke_seg.json_provider import ORJSONProvider
+
+
+@pytest.fixture
+def client():
+    """Test client for an app serving only the model endpoints."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.register_blueprint(model_bp)
+    return app.test_client()
+
+
+def create_model(model_record, created_at: datetime) -> ModelRecord:
+    """Insert another model for the same training."""
+    return ModelRecord.create(training_id=model_record.training_id, model_name='retrained_model',
+                              created_at=created_at)
+
+
+def list_all_pages(client, limit):
+    """Follow X-Next-Cursor from the first page until a page comes back without it."""
+    pages = []
+    url = f'/api/v1/model/list?limit={limit}'
+    while True:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+        assert cursor == pages[-1][-1]['modelId']
+        url = f'/api/v1/model/list?limit={limit}&cursor={cursor}'
+
+
+class TestListModelsPaging:
+    """Test cases for keyset (cursor) paging of /model/list."""
+
+    def test_pages_through_ties_on_created_at(self, client, model_record):
+        """Test that models sharing created_at are each listed once, ordered by ID."""
+        created_at = datetime(2020, 1, 1, 12, 0, 0)
+        model_ids = [create_model(model_record, created_at).id for _ in range(4)]
+
+        pages = list_all_pages(client, limit=2)
+
+        listed = [item['modelId'] for page in pages for item in page]
+        # model_record is newer than the tied models, so it comes first
+        assert listed == [model_record.id] + sorted(model_ids, reverse=True)
+        assert [len(page) for page in pages] == [2, 2, 1]
+
+    def test_full_last_page_is_followed_by_empty_page(self, client, model_record):
+        """Test that a full last page still carries a cursor, which leads to an empty page without one."""
+        create_model(model_record, datetime(2020, 1, 1))
+
+        pages = list_all_pages(client, limit=2)
+
+        assert [len(page) for page in pages] == [2, 0]
+
+    def test_partial_page_has_no_cursor(self, client, model_record):
+        """Test that X-Next-Cursor is only set on a full page."""
+        response = client.get('/api/v1/model/list?limit=2')
+
+        assert len(response.get_json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_deleted_cursor_returns_400(self, client, model_record):
+        """Test that a cursor whose model was deleted between pages is rejected instead of ending the list."""
+        cursor_model = create_model(model_record, datetime(2020, 1, 1))
+        create_model(model_record, datetime(2019, 1, 1))
+        ModelRecord.delete().where(ModelRecord.id == cursor_model.id).execute()
+
+        response = client.get(f'/api/v1/model/list?limit=2&cursor={cursor_model.id}')
+
+        assert response.status_code == 400
+        assert cursor_model.id in response.get_json()['message']
+
+    def test_unknown_cursor_returns_400(self, client, model_record):
+        """Test that a well-formed cursor matching no model is rejected."""
+        response = client.get(f'/api/v1/model/list?limit=2&cursor={uuid.uuid4()}')
+
+        assert response.status_code == 400
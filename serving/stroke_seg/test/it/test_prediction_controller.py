@@ -0,0 +1,159 @@
+"""Integration tests for the prediction list endpoint."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+from stroke_seg.controller.pagination import NEXT_CURSOR_HEADER
+from stroke_seg.controller.prediction_controller import prediction_bp
+from stroke_seg.dao.database import database
+from stroke_seg.dao.models import InferenceRecord
+from stroke_seg.json_provider import ORJSONProvider
+
+LIST_URL = '/api/v1/inference/list?limit=10'
+
+
+@pytest.fixture
+def client():
+    """Test client for an app serving only the prediction endpoints."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.register_blueprint(prediction_bp)
+    return app.test_client()
+
+
+def create_inference(model_record, **fields) -> InferenceRecord:
+    """Insert a pending inference for the model."""
+    return InferenceRecord.create(model_id=model_record, input_data={'images_path': '/data/input'},
+                                  status='PENDING', **fields)
+
+
+def list_all_pages(client, limit):
+    """Follow X-Next-Cursor from the first page until a page comes back without it."""
+    pages = []
+    url = f'/api/v1/inference/list?limit={limit}'
+    while True:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append(response.get_json())
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+        assert cursor == pages[-1][-1]['predictId']
+        url = f'/api/v1/inference/list?limit={limit}&cursor={cursor}'
+
+
+class TestListPredictionsETag:
+    """Test cases for ETag / If-None-Match on /inference/list."""
+
+    def test_unchanged_list_returns_304(self, client, model_record):
+        """Test that revalidating with the current ETag gets an empty 304."""
+        create_inference(model_record)
+        first = client.get(LIST_URL)
+
+        second = client.get(LIST_URL, headers={'If-None-Match': first.headers['ETag']})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == first.headers['ETag']
+
+    @pytest.mark.parametrize('change', ['insert', 'update', 'truncate'])
+    def test_changed_list_returns_200_with_new_etag(self, client, model_record, change):
+        """Test that any write to inference invalidates the ETag, including TRUNCATE."""
+        inference = create_inference(model_record)
+        first = client.get(LIST_URL)
+
+        if change == 'insert':
+            create_inference(model_record)
+        elif change == 'update':
+            InferenceRecord.update(status='PROCESSING').where(
+                InferenceRecord.predict_id == inference.predict_id).execute()
+        else:
+            database.execute_sql(f'TRUNCATE {InferenceRecord._meta.table_name}')
+
+        second = client.get(LIST_URL, headers={'If-None-Match': first.headers['ETag']})
+
+        assert second.status_code == 200
+        assert second.headers['ETag'] != first.headers['ETag']
+        assert second.get_json() != first.get_json()
+
+    def test_etag_depends_on_query_string(self, client, model_record):
+        """Test that a different page of the same data doesn't match the first page's ETag."""
+        create_inference(model_record)
+        first = client.get(LIST_URL)
+
+        other_page = client.get('/api/v1/inference/list?limit=5',
+                                headers={'If-None-Match': first.headers['ETag']})
+
+        assert other_page.status_code == 200
+
+
+class TestListPredictionsPaging:
+    """Test cases for keyset (cursor) paging of /inference/list."""
+
+    def test_pages_through_ties_on_created_at(self, client, model_record):
+        """Test that predictions sharing created_at are each listed once, ordered by ID."""
+        created_at = datetime(2026, 1, 1, 12, 0, 0)
+        predict_ids = [create_inference(model_record, created_at=created_at).predict_id for _ in range(5)]
+
+        pages = list_all_pages(client, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert [item['predictId'] for page in pages for item in page] == sorted(predict_ids, reverse=True)
+
+    def test_pages_newest_first(self, client, model_record):
+        """Test that pages follow created_at descending across page boundaries."""
+        inferences = [create_inference(model_record, created_at=datetime(2026, 1, day)) for day in range(1, 5)]
+
+        pages = list_all_pages(client, limit=3)
+
+        listed = [item['predictId'] for page in pages for item in page]
+        assert listed == [inference.predict_id for inference in reversed(inferences)]
+
+    def test_full_last_page_is_followed_by_empty_page(self, client, model_record):
+        """Test that a full last page still carries a cursor, which leads to an empty page without one."""
+        for _ in range(4):
+            create_inference(model_record)
+
+        pages = list_all_pages(client, limit=2)
+
+        assert [len(page) for page in pages] == [2, 2, 0]
+
+    def test_partial_page_has_no_cursor(self, client, model_record):
+        """Test that X-Next-Cursor is only set on a full page."""
+        create_inference(model_record)
+
+        response = client.get('/api/v1/inference/list?limit=2')
+
+        assert len(response.get_json()) == 1
+        assert NEXT_CURSOR_HEADER not in response.headers
+
+    def test_deleted_cursor_returns_400(self, client, model_record):
+        """Test that a cursor whose prediction was deleted between pages is rejected instead of ending the list."""
+        for _ in range(3):
+            create_inference(model_record)
+        first_page = client.get('/api/v1/inference/list?limit=2')
+        cursor = first_page.headers[NEXT_CURSOR_HEADER]
+        InferenceRecord.delete().where(InferenceRecord.predict_id == cursor).execute()
+
+        response = client.get(f'/api/v1/inference/list?limit=2&cursor={cursor}')
+
+        assert response.status_code == 400
+        assert cursor in response.get_json()['message']
+
+    def test_unknown_cursor_returns_400(self, client, model_record):
+        """Test that a well-formed cursor matching no prediction is rejected."""
+        create_inference(model_record)
+
+        response = client.get(f'/api/v1/inference/list?limit=2&cursor={uuid.uuid4()}')
+
+        assert response.status_code == 400
+
+    def test_malformed_cursor_returns_400(self, client, model_record):
+        """Test that a cursor that isn't a UUID is rejected."""
+        response = client.get('/api/v1/inference/list?limit=2&cursor=not-a-uuid')
+
+        assert response.status_code == 400
@@ -0,0 +1,113 @@
+"""Tests for the BaseJobMonitor poll schedule."""
+
+import pytest
+
+# Load the controllers first, as the app does; importing stroke_seg.bl directly hits a circular import
+import stroke_seg.controller  # noqa: F401
+from stroke_seg.bl.poller.base_job_monitor import BaseJobMonitor
+
+
+class IdleJobMonitor(BaseJobMonitor):
+    """Concrete monitor with no jobs, so only the base class's scheduling is exercised."""
+
+    def _get_jobs_to_monitor(self):
+        return []
+
+    async def _handle_job_update(self, job, job_info, current_status, new_status):
+        return False
+
+
+class FakeLoop:
+    """Event loop stand-in whose time() returns whatever the test sets."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+def create_monitor(poll_interval, start: float = 100.0) -> IdleJobMonitor:
+    """Monitor whose schedule starts at the given loop time, as _poll_loop does."""
+    monitor = IdleJobMonitor(job_dao=object(), slurm_client=object(), poll_interval=poll_interval)
+    monitor._next_run = start
+    return monitor
+
+
+class TestDelayUntilNextCycle:
+    """Test cases for BaseJobMonitor._delay_until_next_cycle."""
+
+    def test_delay_subtracts_time_spent_polling(self):
+        """Test that the next cycle is due one interval after the previous one started, not after it finished."""
+        monitor = create_monitor(poll_interval=30)
+        loop = FakeLoop(now=104.0)
+
+        assert monitor._delay_until_next_cycle(loop) == 26.0
+        assert monitor._next_run == 130.0
+
+    def test_schedule_does_not_drift(self):
+        """Test that cycles of varying length keep starting on the fixed-rate grid."""
+        monitor = create_monitor(poll_interval=30)
+        loop = FakeLoop()
+        due_times = []
+
+        for poll_duration in [2.0, 7.5, 0.1, 29.0]:
+            loop.now = monitor._next_run + poll_duration
+            delay = monitor._delay_until_next_cycle(loop)
+            due_times.append(loop.now + delay)
+
+        assert due_times == [130.0, 160.0, 190.0, 220.0]
+
+    def test_cycle_ending_exactly_on_next_slot_does_not_wait(self):
+        """Test that a cycle lasting exactly one interval starts the next one immediately."""
+        monitor = create_monitor(poll_interval=30)
+
+        assert monitor._delay_until_next_cycle(FakeLoop(now=130.0)) == 0.0
+        assert monitor._next_run == 130.0
+
+    def test_overrun_skips_missed_slots(self):
+        """Test that a cycle overrunning several intervals waits for the next slot instead of polling back to back."""
+        monitor = create_monitor(poll_interval=30)
+        loop = FakeLoop(now=195.0)
+
+        delay = monitor._delay_until_next_cycle(loop)
+
+        # Slots at 130 and 160 were missed; 190 is also past, so the next one is 220
+        assert delay == 25.0
+        assert monitor._next_run == 220.0
+
+    def test_schedule_stays_on_grid_after_overrun(self):
+        """Test that cycles after an overrun are again one interval apart, on the original grid."""
+        monitor = create_monitor(poll_interval=30)
+        loop = FakeLoop(now=175.0)
+        monitor._delay_until_next_cycle(loop)
+
+        loop.now = monitor._next_run + 1.0
+        delay = monitor._delay_until_next_cycle(loop)
+
+        assert monitor._next_run == 220.0
+        assert delay == 29.0
+
+
+class TestPollIntervalValidation:
+    """Test cases for BaseJobMonitor's poll interval check."""
+
+    @pytest.mark.parametrize('poll_interval', [0, -5])
+    def test_non_positive_interval_argument_raises(self, poll_interval):
+        """Test that a zero or negative poll_interval is rejected."""
+        with pytest.raises(ValueError, match='Polling interval must be a positive number'):
+            IdleJobMonitor(job_dao=object(), slurm_client=object(), poll_interval=poll_interval)
+
+    @pytest.mark.parametrize('env_value', ['0', '-30'])
+    def test_non_positive_interval_from_env_raises(self, monkeypatch, env_value):
+        """Test that a zero or negative SLURM_POLL_INTERVAL is rejected when no interval is passed."""
+        monkeypatch.setenv('SLURM_POLL_INTERVAL', env_value)
+
+        with pytest.raises(ValueError, match='Polling interval must be a positive number'):
+            IdleJobMonitor(job_dao=object(), slurm_client=object())
+
+    def test_interval_defaults_to_env(self, monkeypatch):
+        """Test that SLURM_POLL_INTERVAL is used when no interval is passed."""
+        monkeypatch.setenv('SLURM_POLL_INTERVAL', '45')
+
+        assert IdleJobMonitor(job_dao=object(), slurm_client=object()).poll_interval == 45
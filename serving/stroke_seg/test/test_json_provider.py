@@ -0,0 +1,95 @@
+"""Tests for ORJSONProvider."""
+
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from stroke_seg.json_provider import ORJSONProvider
+
+
+PREDICT_ID = uuid.UUID('6f1c3a52-8d0e-4b7a-9c1f-2e5d7a9b0c31')
+MODEL_ID = uuid.UUID('0a9b8c7d-6e5f-4a3b-8c2d-1e0f9a8b7c6d')
+
+
+@pytest.fixture
+def app():
+    """Flask app in production mode, so responses use the compact encoding."""
+    return Flask(__name__)
+
+
+def legacy_status_body(created_at: datetime, end_time: datetime) -> dict:
+    """Prediction status body as the BL built it before ORJSONProvider: IDs and times pre-formatted as strings."""
+    return {
+        'predictId': str(PREDICT_ID),
+        'status': 'COMPLETED',
+        'modelId': str(MODEL_ID),
+        'startTime': created_at.isoformat() + 'Z',
+        'endTime': end_time.isoformat() + 'Z',
+    }
+
+
+def status_body(created_at: datetime, end_time: datetime) -> dict:
+    """The same body with raw UUID and datetime values, left to the JSON provider."""
+    return {
+        'predictId': PREDICT_ID,
+        'status': 'COMPLETED',
+        'modelId': MODEL_ID,
+        'startTime': created_at,
+        'endTime': end_time,
+    }
+
+
+class TestORJSONProvider:
+    """Test cases for ORJSONProvider."""
+
+    @pytest.mark.parametrize('value', [
+        datetime(2026, 1, 1, 12, 30, 5),
+        datetime(2026, 1, 1, 12, 30, 5, 123456),
+        datetime(2026, 1, 1, 12, 30, 5, 1000),
+    ])
+    def test_naive_datetime_matches_previous_format(self, app, value):
+        """Test that a naive datetime serializes as the BL's former isoformat() + 'Z' string."""
+        assert ORJSONProvider(app).dumps(value) == DefaultJSONProvider(app).dumps(value.isoformat() + 'Z')
+
+    def test_uuid_matches_previous_format(self, app):
+        """Test that a UUID serializes as the BL's former str(uuid) string."""
+        assert ORJSONProvider(app).dumps(PREDICT_ID) == DefaultJSONProvider(app).dumps(str(PREDICT_ID))
+
+    def test_response_bytes_match_previous_provider(self, app):
+        """Test that a response with raw values is byte-identical to Flask's provider on the pre-formatted body."""
+        created_at = datetime(2026, 3, 14, 9, 26, 53, 589793)
+        end_time = datetime(2026, 3, 14, 10, 0, 0)
+
+        new = ORJSONProvider(app).response(status_body(created_at, end_time))
+        old = DefaultJSONProvider(app).response(legacy_status_body(created_at, end_time))
+
+        assert new.get_data() == old.get_data()
+        assert new.mimetype == old.mimetype
+
+    def test_list_response_bytes_match_previous_provider(self, app):
+        """Test that a list of items, as the list endpoints return, is byte-identical too."""
+        created_at = datetime(2026, 3, 14, 9, 26, 53)
+        items = [status_body(created_at, created_at), status_body(created_at, created_at)]
+        legacy_items = [legacy_status_body(created_at, created_at), legacy_status_body(created_at, created_at)]
+
+        new = ORJSONProvider(app).response(items)
+        old = DefaultJSONProvider(app).response(legacy_items)
+
+        assert new.get_data() == old.get_data()
+
+    def test_keys_sorted(self, app):
+        """Test that keys are sorted, as with Flask's default provider."""
+        assert ORJSONProvider(app).dumps({'b': 1, 'a': 2}) == '{"a":2,"b":1}'
+
+    def test_unsupported_type_falls_back_to_flask_default(self, app):
+        """Test that types orjson doesn't handle, like Decimal, go through Flask's default hook."""
+        assert ORJSONProvider(app).dumps(Decimal('0.875')) == '"0.875"'
+
+    @pytest.mark.parametrize('payload', ['{"modelId": "abc", "limit": 5}', b'{"modelId": "abc", "limit": 5}'])
+    def test_loads_accepts_str_and_bytes(self, app, payload):
+        """Test that request bodies are parsed from either str or bytes."""
+        assert ORJSONProvider(app).loads(payload) == {'modelId': 'abc', 'limit': 5}
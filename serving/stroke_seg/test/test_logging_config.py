@@ -0,0 +1,110 @@
+"""Tests for BufferedRotatingFileHandler."""
+
+import logging
+import time
+
+import pytest
+
+from stroke_seg.logging_config import BufferedRotatingFileHandler
+
+
+# Two bytes per character in UTF-8
+MULTI_BYTE_MESSAGE = 'é' * 20
+
+
+def make_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    """Build a log record with the given message and level."""
+    return logging.LogRecord('test', level, __file__, 0, message, None, None)
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or timeout seconds pass."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Path of the log file in a fresh directory."""
+    return tmp_path / 'service.log'
+
+
+@pytest.fixture
+def make_handler(log_file):
+    """Create handlers writing to log_file, closing them after the test."""
+    handlers = []
+
+    def _make_handler(**kwargs):
+        handler = BufferedRotatingFileHandler(str(log_file), encoding='utf-8', **kwargs)
+        handlers.append(handler)
+        return handler
+
+    yield _make_handler
+    for handler in handlers:
+        handler.close()
+
+
+class TestBufferedRotatingFileHandler:
+    """Test cases for BufferedRotatingFileHandler."""
+
+    def test_rollover_counts_encoded_bytes(self, make_handler, log_file):
+        """Test that files roll over before exceeding maxBytes in bytes, not characters, with multi-byte text."""
+        handler = make_handler(maxBytes=100, backupCount=5)
+        record_size = len((MULTI_BYTE_MESSAGE + '\n').encode('utf-8'))
+
+        for _ in range(5):
+            handler.emit(make_record(MULTI_BYTE_MESSAGE))
+        handler.close()
+
+        files = [log_file] + [log_file.with_name(f'{log_file.name}.{i}') for i in (1, 2)]
+        assert not log_file.with_name(f'{log_file.name}.3').exists()
+        # 41-byte records: two fit under 100 bytes, a third would not
+        assert [path.stat().st_size for path in files] == [record_size, 2 * record_size, 2 * record_size]
+        assert all(path.stat().st_size <= 100 for path in files)
+        lines = [line for path in files for line in path.read_text(encoding='utf-8').splitlines()]
+        assert lines == [MULTI_BYTE_MESSAGE] * 5
+
+    def test_rollover_counts_existing_file_size(self, make_handler, log_file):
+        """Test that bytes already in the file when it is opened count towards maxBytes."""
+        log_file.write_bytes(b'x' * 90 + b'\n')
+        handler = make_handler(maxBytes=100, backupCount=1)
+
+        handler.emit(make_record(MULTI_BYTE_MESSAGE))
+        handler.close()
+
+        assert log_file.with_name(f'{log_file.name}.1').read_bytes() == b'x' * 90 + b'\n'
+        assert log_file.read_text(encoding='utf-8') == MULTI_BYTE_MESSAGE + '\n'
+
+    @pytest.mark.parametrize('level', [logging.WARNING, logging.ERROR])
+    def test_warning_and_above_flushed_immediately(self, make_handler, log_file, level):
+        """Test that records at or above flush_level reach the file as soon as they are emitted."""
+        handler = make_handler(flush_interval=60)
+
+        handler.emit(make_record('disk is full', level))
+
+        assert log_file.read_text(encoding='utf-8') == 'disk is full\n'
+
+    def test_info_buffered_until_flush_interval(self, make_handler, log_file):
+        """Test that records below flush_level stay buffered, then reach the file after flush_interval."""
+        handler = make_handler(flush_interval=0.2)
+
+        handler.emit(make_record('job 42 polled'))
+
+        assert log_file.read_text(encoding='utf-8') == ''
+        assert wait_for(lambda: log_file.read_text(encoding='utf-8') == 'job 42 polled\n')
+
+    def test_close_stops_flush_thread(self, make_handler, log_file):
+        """Test that close() flushes pending records and ends the periodic flush thread."""
+        handler = make_handler(flush_interval=60)
+        handler.emit(make_record('shutting down'))
+        assert handler._flush_thread.is_alive()
+
+        handler.close()
+        handler._flush_thread.join(timeout=5)
+
+        assert not handler._flush_thread.is_alive()
+        assert log_file.read_text(encoding='utf-8') == 'shutting down\n'
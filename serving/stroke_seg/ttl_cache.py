@@ -0,0 +1,43 @@
+"""Small time-based memoization helper for cheap-to-serve, expensive-to-probe values."""
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+
+
+def ttl_cache(seconds: float = 1.0) -> Callable:
+    """
+    Cache a function's return value per argument set for a number of seconds.
+
+    Exceptions are not cached. Cached values are shared between callers, so
+    they must be treated as read-only.
+
+    Args:
+        seconds: How long a computed value is served before it is recomputed
+
+    Returns:
+        Decorator wrapping the function; the wrapper exposes cache_clear()
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(*args, **kwargs)
+            with lock:
+                cache[key] = (now + seconds, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator